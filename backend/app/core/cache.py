@@ -25,6 +25,21 @@ from typing import Any
 
 logger = logging.getLogger("iesa_backend")
 
+# orjson (optional) is several times faster than json for the payloads
+# cached here; either way values round-trip as plain JSON.
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(value: Any) -> str:  # type: ignore[misc]
+        return json.dumps(value, default=str)
+
+    _loads = json.loads
+
 _redis_client = None
 _redis_checked = False
 
@@ -74,7 +89,7 @@ async def cache_get(key: str) -> Any | None:
         raw = await r.get(f"{CACHE_PREFIX}{key}")
         if raw is None:
             return None
-        return json.loads(raw)
+        return _loads(raw)
     except Exception:
         return None
 
@@ -85,7 +100,7 @@ async def cache_set(key: str, value: Any, ttl: int = 60) -> None:
     if r is None:
         return
     try:
-        await r.set(f"{CACHE_PREFIX}{key}", json.dumps(value, default=str), ex=ttl)
+        await r.set(f"{CACHE_PREFIX}{key}", _dumps(value), ex=ttl)
     except Exception:
         pass
 
@@ -108,7 +123,14 @@ async def cache_delete_pattern(pattern: str) -> None:
         return
     try:
         full = f"{CACHE_PREFIX}{pattern}"
+        # Delete in batches — one round-trip per 100 keys, not one per key
+        batch: list[str] = []
         async for k in r.scan_iter(match=full, count=100):
-            await r.delete(k)
+            batch.append(k)
+            if len(batch) >= 100:
+                await r.delete(*batch)
+                batch.clear()
+        if batch:
+            await r.delete(*batch)
     except Exception:
         pass
@@ -7,8 +7,10 @@ Supports multiple providers (SendGrid, Resend, SMTP).
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
+import asyncio
 import os
 import logging
+import time
 from enum import Enum
 from html import escape
 
@@ -76,6 +78,14 @@ class EmailService:
         self._limits_cache_ttl_seconds = 60
         self._limits_cache_loaded_at = 0.0
         self._limits_cache: dict[str, Any] | None = None
+        # Resend's API allows 2 requests/s by default, so Resend sends draw from
+        # a local token bucket instead of collecting 429s. SMTP/SendGrid have no
+        # such cap and are not throttled. 0 disables the bucket.
+        self.send_rate_per_second = max(0, self._env_int("EMAIL_SEND_RATE_PER_SECOND", 2))
+        self.send_burst = max(1, self._env_int("EMAIL_SEND_BURST", self.send_rate_per_second))
+        self._send_tokens = float(self.send_burst)
+        self._send_tokens_at = time.monotonic()
+        self._priority_sends_waiting = 0
         
         if self.provider == EmailProvider.SENDGRID:
             self._init_sendgrid()
@@ -105,6 +115,33 @@ class EmailService:
     def _utc_day_key() -> str:
         return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
+    async def _acquire_send_token(self, bulk: bool = False) -> None:
+        """
+        Take one token from the Resend bucket, waiting for a refill when empty.
+        Bulk sends only take a token while no transactional send is waiting,
+        so a large announcement never holds up receipts or verification mail.
+        """
+        rate = self.send_rate_per_second
+        if rate <= 0:
+            return
+        if not bulk:
+            self._priority_sends_waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self._send_tokens = min(
+                    self.send_burst,
+                    self._send_tokens + (now - self._send_tokens_at) * rate,
+                )
+                self._send_tokens_at = now
+                if self._send_tokens >= 1 and (not bulk or self._priority_sends_waiting == 0):
+                    self._send_tokens -= 1
+                    return
+                await asyncio.sleep(max((1 - self._send_tokens) / rate, 0.05))
+        finally:
+            if not bulk:
+                self._priority_sends_waiting -= 1
+
     def invalidate_limit_cache(self) -> None:
         self._limits_cache = None
         self._limits_cache_loaded_at = 0.0
@@ -123,8 +160,6 @@ class EmailService:
         return await self._resolve_limit_config()
 
     async def _resolve_limit_config(self) -> dict[str, Any]:
-        import time
-
         now = time.monotonic()
         if self._limits_cache and (now - self._limits_cache_loaded_at) < self._limits_cache_ttl_seconds:
             return self._limits_cache
@@ -397,7 +432,8 @@ class EmailService:
         subject: str,
         html_content: str,
         text_content: Optional[str] = None,
-        attachments: Optional[List[Dict[str, Any]]] = None
+        attachments: Optional[List[Dict[str, Any]]] = None,
+        bulk: bool = False
     ) -> bool:
         """
         Send an email using the configured provider.
@@ -408,6 +444,8 @@ class EmailService:
             html_content: HTML email body
             text_content: Plain text fallback
             attachments: List of attachments (for receipts, etc.)
+            bulk: Mass mailing (announcements, invites) — yields rate-limit
+                tokens to transactional sends
             
         Returns:
             True if sent successfully, False otherwise
@@ -425,7 +463,7 @@ class EmailService:
                     logger.info("📎 Attachments detected — using SMTP fallback for attachment-safe delivery")
                     return await self._send_smtp(to, subject, html_content, text_content, attachments)
 
-                success = await self._send_resend(to, subject, html_content, text_content)
+                success = await self._send_resend(to, subject, html_content, text_content, bulk=bulk)
 
                 if not success and self.smtp_fallback_enabled:
                     logger.warning("⚠️ Resend failed — retrying with SMTP fallback")
@@ -489,7 +527,7 @@ class EmailService:
         
         return success
     
-    async def _send_resend(self, to, subject, html_content, text_content):
+    async def _send_resend(self, to, subject, html_content, text_content, bulk=False):
         """Send email via Resend"""
         allowed, quota = await self._reserve_send_slot("resend")
         if not allowed:
@@ -498,6 +536,8 @@ class EmailService:
             )
             return False
 
+        await self._acquire_send_token(bulk=bulk)
+
         params = {
             "from": f"{self.from_name} <{self.from_email}>",
             "to": [to],
@@ -659,7 +699,8 @@ class EmailService:
         self,
         to: str,
         template: EmailTemplate,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        bulk: bool = False
     ) -> bool:
         """
         Send a templated email.
@@ -668,9 +709,10 @@ class EmailService:
             to: Recipient email
             template: EmailTemplate enum
             context: Template variables
+            bulk: Mass mailing — see send_email
         """
         subject, html = self._render_template(template, context)
-        return await self.send_email(to, subject, html)
+        return await self.send_email(to, subject, html, bulk=bulk)
     
     def _render_template(self, template: EmailTemplate, context: Dict[str, Any]) -> tuple[str, str]:
         """Render email template"""
@@ -934,15 +976,14 @@ async def send_payment_receipt(
 ):
     """Send a payment receipt email with PDF attachment"""
     from datetime import datetime
-    from ..utils.receipt_generator import ReceiptGenerator
+    from ..utils.receipt_generator import generate_payment_receipt_async
     
     service = get_email_service()
     
     # Generate PDF receipt
     pdf_buffer = None
     try:
-        generator = ReceiptGenerator()
-        pdf_buffer = generator.generate_receipt(
+        pdf_buffer = await generate_payment_receipt_async(
             transaction_id=transaction_id or reference,
             reference=reference,
             student_name=student_name,
@@ -1044,7 +1085,8 @@ async def send_announcement_email(
             "priority": priority,
             "target_label": target_label,
             "dashboard_url": resolved_dashboard_url,
-        }
+        },
+        bulk=True,
     )
 
 
@@ -50,8 +50,14 @@ def safe_detail(prefix: str, exc: Exception) -> str:
     return f"{prefix}: {exc}"
 
 
+# Strong references to in-flight background tasks — the event loop only keeps
+# weak ones, so an unreferenced task can be garbage-collected mid-run
+_background_tasks: set = set()
+
+
 def _log_bg_task_exception(task):
     """Callback for asyncio.create_task — logs unhandled exceptions from fire-and-forget tasks."""
+    _background_tasks.discard(task)
     if task.cancelled():
         return
     exc = task.exception()
@@ -67,6 +73,7 @@ def fire_and_forget(coro):
     """
     import asyncio
     task = asyncio.create_task(coro)
+    _background_tasks.add(task)
     task.add_done_callback(_log_bg_task_exception)
     return task
 
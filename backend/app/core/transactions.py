@@ -51,7 +51,8 @@ async def run_in_transaction(
                     return result
                     
             except Exception as e:
-                await session.abort_transaction()
+                # start_transaction()'s context manager has already aborted;
+                # aborting again would raise InvalidOperation and mask e
                 
                 # Check if this is a transient error we can retry
                 error_labels = getattr(e, "error_labels", [])
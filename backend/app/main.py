@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 from datetime import datetime, timezone
 from pymongo.errors import OperationFailure
 import os
@@ -10,7 +11,7 @@ import time
 from app.core.security import verify_token
 from app.core.permissions import require_permission as _require_permission
 from app.core.rate_limiting import setup_rate_limiting
-from app.core.error_handling import setup_exception_handlers, setup_logging
+from app.core.error_handling import fire_and_forget, setup_exception_handlers, setup_logging
 from app.core.scheduler import start_scheduler, stop_scheduler
 from app.routers import sessions, users, payments, events, announcements, enrollments, roles, students, iesa_ai, resources, timetable, paystack, audit_logs, auth, study_groups, press, team_applications, teams, academic_calendar, timp, bank_transfers, settings, contact_messages, iepod, admin_stats, student_dashboard, sse, notifications, search, messages, class_rep, team_head, push_notifications, drive, alumni, analytics, campaigns, treasury, growth
 from app.db import connect_to_mongo, close_mongo_connection, get_database
@@ -198,6 +199,11 @@ async def lifespan(app: FastAPI):
     # Start background scheduler (birthday wishes, event/payment reminders, planner alerts)
     start_scheduler()
 
+    # Optionally pre-import the PDF stack off the event loop (RECEIPT_PREWARM=1)
+    from app.utils.receipt_generator import RECEIPT_PREWARM, warmup_receipt_generator
+    if RECEIPT_PREWARM:
+        fire_and_forget(asyncio.to_thread(warmup_receipt_generator))
+
     yield
     # Shutdown
     stop_scheduler()
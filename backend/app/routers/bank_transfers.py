@@ -507,6 +507,8 @@ async def review_transfer(
             )
         # Delete transaction record
         await db.transactions.delete_one({"bankTransferId": transfer_id})
+        from app.core.cache import cache_delete
+        await cache_delete(f"ai_user_context:{student_id}")
     
     # If it is now being approved
     elif data.status == "approved":
@@ -528,6 +530,9 @@ async def review_transfer(
                 },
             )
         
+        from app.core.cache import cache_delete
+        await cache_delete(f"ai_user_context:{student_id}")
+
         # Create a transaction record
         await db.transactions.insert_one({
             "paymentId": payment_id,
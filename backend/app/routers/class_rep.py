@@ -1010,7 +1010,7 @@ async def remind_unpaid_payment_students(
 
             for recipient in recipient_emails:
                 email_queued += 1
-                send_jobs.append(service.send_email(to=recipient, subject=subject, html_content=html))
+                send_jobs.append(service.send_email(to=recipient, subject=subject, html_content=html, bulk=True))
 
         if send_jobs:
             async def _send_all_emails():
@@ -6,7 +6,7 @@ Events from different academic sessions are completely separate.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 import re
 from typing import List, Optional
@@ -688,7 +688,6 @@ async def pay_for_event(
     Returns Paystack authorization URL and reference.
     """
     import httpx
-    import os
     
     db = get_database()
     events_col = db["events"]
@@ -725,10 +724,9 @@ async def pay_for_event(
             raise HTTPException(status_code=400, detail="You have already paid for this event")
     
     # Generate reference
-    from app.routers.paystack import generate_payment_reference
+    from app.routers.paystack import generate_payment_reference, PAYSTACK_SECRET_KEY, FRONTEND_URL
     reference = generate_payment_reference(user["_id"])
     
-    PAYSTACK_SECRET_KEY = os.getenv("PAYSTACK_SECRET_KEY", "")
     if not PAYSTACK_SECRET_KEY:
         raise HTTPException(status_code=503, detail="Payment service not configured")
     
@@ -742,7 +740,7 @@ async def pay_for_event(
         "email": user.get("email", "student@example.com"),
         "amount": amount_kobo,
         "reference": reference,
-        "callback_url": f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/dashboard/events?payment_ref={reference}",
+        "callback_url": f"{FRONTEND_URL}/dashboard/events?payment_ref={reference}",
         "metadata": {
             "studentId": user["_id"],
             "studentName": _ev_student_name,
@@ -1528,8 +1526,8 @@ async def download_event_ticket(
             event_date = datetime.now(timezone.utc)
         
         # Generate PDF ticket
-        from ..utils.ticket_generator import generate_event_ticket
-        pdf_buffer = generate_event_ticket(
+        from ..utils.ticket_generator import generate_event_ticket_bytes
+        pdf_bytes = generate_event_ticket_bytes(
             event_id=str(event["_id"]),
             event_title=event.get("title", "IESA Event"),
             event_date=event_date,
@@ -1543,8 +1541,8 @@ async def download_event_ticket(
         )
         
         # Return PDF as downloadable file
-        return StreamingResponse(
-            pdf_buffer,
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename=IESA_Ticket_{event_id}.pdf"
@@ -12,21 +12,24 @@ Uses RAG (Retrieval Augmented Generation) with live database context.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, AsyncGenerator
 from datetime import datetime, timezone, timedelta, date
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 import os
+import re
 import json
 import logging
 import asyncio
+import time
 
 from ..core.security import get_current_user, require_ipe_student
 from ..core.rate_limiting import limiter
+from ..core.cache import cache_get, cache_set
 from ..db import get_database
-from ..services.vector_store import vector_store
+from ..services.vector_store import vector_store, STOP_WORDS
 
 logger = logging.getLogger("iesa_backend")
 
@@ -40,6 +43,65 @@ AI_MODEL_FAST = os.getenv("AI_MODEL_FAST", "openai/gpt-oss-120b")
 AI_MODEL_SUMMARY = os.getenv("AI_MODEL_SUMMARY", "openai/gpt-oss-120b")
 AI_MODEL_ROUTING_ENABLED = os.getenv("AI_MODEL_ROUTING_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
 
+# Synced conversation lists are cached in Redis so every replica shares them;
+# the TTL lets inactive accounts fall out of the cache on their own.
+CONVERSATIONS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Per-student AI context (~20 queries to build) is reused across messages
+# for a minute; payment and profile writes evict it (ai_user_context:<id>).
+USER_CONTEXT_CACHE_TTL = 60  # seconds
+
+
+# Prompt budget for replayed chat history (~4 characters per token)
+AI_HISTORY_TOKEN_BUDGET = int(os.getenv("AI_HISTORY_TOKEN_BUDGET", "1000"))
+
+
+def _fit_to_budget(history: List[dict], max_tokens: int = AI_HISTORY_TOKEN_BUDGET) -> List[dict]:
+    """Return the most recent messages whose estimated size fits max_tokens."""
+    used = 0
+    start = len(history)
+    for i in range(len(history) - 1, -1, -1):
+        used += len(str(history[i].get("content", ""))) // 4 + 1
+        if used > max_tokens:
+            break
+        start = i
+    return history[start:]
+
+
+def _clip_history(history: List[dict]) -> List[dict]:
+    """
+    Truncate each replayed message to 500 chars, then keep as many recent
+    ones as fit the token budget.
+    """
+    clipped = []
+    for msg in history:
+        content = str(msg.get("content", ""))
+        if len(content) > 500:
+            content = content[:500] + "..."
+        clipped.append({"role": msg.get("role", "user"), "content": content})
+    return _fit_to_budget(clipped)
+
+
+def _is_payload_too_large(error_msg: str) -> bool:
+    """Whether a (lower-cased) Groq error means the request was too large (413)."""
+    return "413" in error_msg or "payload" in error_msg or "too large" in error_msg or "request_too_large" in error_msg
+
+
+async def _concise_fallback_reply(message: str, language: str) -> Optional[str]:
+    """Retry once with the static prompt and the user message only (413 recovery)."""
+    truncated_prompt = f"{_SYSTEM_PROMPT_STATIC[:3000]}\n\n{_language_section(language)}"
+    minimal_messages = [
+        {"role": "system", "content": truncated_prompt},
+        {"role": "user", "content": message[:1000]}
+    ]
+    fallback_comp = await _groq_complete(
+        model="llama-3.1-8b-instant",
+        messages=minimal_messages,  # type: ignore
+        temperature=0.6,
+        max_tokens=600,
+    )
+    return fallback_comp.choices[0].message.content
+
 
 def select_chat_model(user_message: str, conversation_history: Optional[List[dict]] = None) -> str:
     """Choose a Groq model based on query complexity.
@@ -288,13 +350,88 @@ async def _rollback_ai_usage(account_key: str, db, legacy_user_id: str | None =
 
     await col.update_one({"_id": doc["_id"]}, update_doc)
 
-# Groq API setup
+class GroqKeyPool:
+    """
+    Spread Groq calls across several API keys.
+
+    Each call goes to the available key with the fewest in-flight requests.
+    A key that gets a 429 sits out its retry-after window while the call is
+    retried on the next key; connection/5xx errors also fail over.
+    """
+
+    DEFAULT_COOLDOWN = 10.0  # seconds, when a 429 carries no retry-after
+
+    def __init__(self, clients: list):
+        self._clients = clients
+        self._inflight = [0] * len(clients)
+        self._cooldown_until = [0.0] * len(clients)
+
+    def _pick(self) -> int:
+        now = time.monotonic()
+        indices = range(len(self._clients))
+        available = [i for i in indices if self._cooldown_until[i] <= now]
+        if not available:
+            # Every key is cooling down — use the one that recovers first
+            return min(indices, key=lambda i: self._cooldown_until[i])
+        return min(available, key=lambda i: self._inflight[i])
+
+    def _cooldown_for(self, error) -> float:
+        try:
+            return float(error.response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            return self.DEFAULT_COOLDOWN
+
+    async def _track_stream(self, i: int, stream):
+        """Yield a streamed response's chunks, keeping key i in flight until it closes."""
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            self._inflight[i] -= 1
+
+    async def create(self, **kwargs):
+        """
+        chat.completions.create on the best key, failing over on 429/5xx.
+        With stream=True the key stays counted as in flight until the
+        returned iterator is exhausted or closed.
+        """
+        last_error = None
+        for _ in range(len(self._clients)):
+            i = self._pick()
+            self._inflight[i] += 1
+            handed_off = False
+            try:
+                response = await self._clients[i].chat.completions.create(**kwargs)
+                if kwargs.get("stream"):
+                    handed_off = True
+                    return self._track_stream(i, response)
+                return response
+            except RateLimitError as e:
+                self._cooldown_until[i] = time.monotonic() + self._cooldown_for(e)
+                last_error = e
+            except (APIConnectionError, InternalServerError) as e:
+                last_error = e
+            finally:
+                if not handed_off:
+                    self._inflight[i] -= 1
+        raise last_error
+
+
+# Groq API setup — GROQ_API_KEYS (comma-separated) enables the key pool;
+# a single GROQ_API_KEY still works on its own.
 try:
-    from groq import Groq
+    from groq import AsyncGroq, APIConnectionError, InternalServerError, RateLimitError
     GROQ_AVAILABLE = True
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    GROQ_API_KEYS = [k.strip() for k in os.getenv("GROQ_API_KEYS", "").split(",") if k.strip()]
+    GROQ_API_KEY = os.getenv("GROQ_API_KEY") or (GROQ_API_KEYS[0] if GROQ_API_KEYS else None)
     if GROQ_API_KEY:
-        groq_client = Groq(api_key=GROQ_API_KEY)
+        _pool_keys = GROQ_API_KEYS or [GROQ_API_KEY]
+        # With several keys, fail over immediately rather than let the SDK
+        # back off and retry on the same rate-limited key
+        groq_pool = GroqKeyPool([
+            AsyncGroq(api_key=k, max_retries=0 if len(_pool_keys) > 1 else 2)
+            for k in _pool_keys
+        ])
     else:
         GROQ_AVAILABLE = False
         print("Warning: GROQ_API_KEY not found in environment variables")
@@ -302,6 +439,51 @@ except ImportError:
     GROQ_AVAILABLE = False
     print("Warning: groq package not installed. Install with: pip install groq")
 
+# Cap in-flight Groq requests per worker so bursts queue here instead of
+# tripping Groq's per-minute limits (size it to the account's RPM budget).
+GROQ_CONCURRENCY = int(os.getenv("GROQ_CONCURRENCY", "8"))
+_groq_slots = asyncio.Semaphore(GROQ_CONCURRENCY)
+
+
+async def _groq_complete(**kwargs):
+    """Run one Groq chat completion within the concurrency cap."""
+    async with _groq_slots:
+        return await groq_pool.create(**kwargs)
+
+
+async def _groq_stream_tokens(**kwargs) -> AsyncGenerator[str, None]:
+    """
+    Yield the tokens of a streamed Groq completion. A producer task holds a
+    concurrency slot only while reading from Groq and buffers tokens in a
+    queue, so a slow client never keeps a slot busy.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    async def produce():
+        try:
+            async with _groq_slots:
+                stream = await groq_pool.create(stream=True, **kwargs)
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        queue.put_nowait(chunk.choices[0].delta.content)
+            queue.put_nowait(finished)
+        except Exception as e:
+            queue.put_nowait(e)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is finished:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # No-op once drained; stops the upstream read if the client went away
+        producer.cancel()
+
 
 class ChatMessage(BaseModel):
     message: str
@@ -664,7 +846,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
 
             return profile
         except Exception as e:
-            logger.warning(f"Founder profile context fetch error: {e}")
+            logger.warning("Founder profile context fetch error: %s", e)
             return {**PUBLIC_FOUNDER_PROFILE, "current_positions": []}
 
     # ── Derive numeric level once ──
@@ -697,7 +879,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
                 }).sort("date", 1).limit(10).to_list(length=10)
             return results
         except Exception as e:
-            logger.warning(f"Events fetch error: {e}")
+            logger.warning("Events fetch error: %s", e)
             return []
 
     async def _fetch_timetable():
@@ -717,7 +899,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
             }).sort([("day", 1), ("startTime", 1)]).to_list(length=50)
             return today, week
         except Exception as e:
-            logger.warning(f"Timetable fetch error: {e}")
+            logger.warning("Timetable fetch error: %s", e)
             return [], []
 
     async def _fetch_academic_calendar():
@@ -731,7 +913,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
                 ]
             }).sort("startDate", 1).to_list(length=25)
         except Exception as e:
-            logger.warning(f"Academic calendar fetch error: {e}")
+            logger.warning("Academic calendar fetch error: %s", e)
             return []
 
     async def _fetch_resources():
@@ -742,7 +924,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
                 "isApproved": True, "level": numeric_level,
             }).sort("createdAt", -1).limit(15).to_list(length=15)
         except Exception as e:
-            logger.warning(f"Resources fetch error: {e}")
+            logger.warning("Resources fetch error: %s", e)
             return []
 
     async def _fetch_iepod():
@@ -751,7 +933,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
                 "userId": user_id, "sessionId": session_id
             })
         except Exception as e:
-            logger.warning(f"IEPOD fetch error: {e}")
+            logger.warning("IEPOD fetch error: %s", e)
             return None
 
     async def _fetch_timp():
@@ -771,7 +953,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
             }).sort("createdAt", -1).to_list(length=20)
             return app, mentee_pair, mentor_pairs
         except Exception as e:
-            logger.warning(f"TIMP fetch error: {e}")
+            logger.warning("TIMP fetch error: %s", e)
             return None, None, []
 
     async def _fetch_my_active_roles():
@@ -987,7 +1169,7 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
                 "teams": team_roles_bucket,
             }
         except Exception as e:
-            logger.warning(f"Team roles fetch error: {e}")
+            logger.warning("Team roles fetch error: %s", e)
             return {
                 "executives": [],
                 "class_reps": [],
@@ -1353,9 +1535,99 @@ async def get_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
     return context
 
 
+async def _cached_user_context(user_id: str, db: AsyncIOMotorDatabase) -> dict:
+    """get_user_context with a short per-student Redis cache."""
+    cache_key = f"ai_user_context:{user_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
+    context = await get_user_context(user_id, db)
+    await cache_set(cache_key, context, ttl=USER_CONTEXT_CACHE_TTL)
+    return context
+
+
+# Language-specific instructions
+LANGUAGE_INSTRUCTIONS = {
+    "en": "Respond in clear, professional Nigerian English. Be warm and respectful, with natural local phrasing where appropriate, but avoid slang-heavy wording.",
+
+    "pcm": """Respond ENTIRELY in Nigerian Pidgin English throughout this conversation. 
+Use authentic expressions: "How far?", "E go sweet you", "No wahala", "Wetin dey happen?", "Na so", "Sharp sharp", "Bros/Sisi", "Chai!", "Ehen!", "Omo!", "E be like say".
+Keep it friendly like you dey gist with your paddy. Mix English only for technical terms.
+Example: "Bros, your payment don enter! You fit download receipt for the Payment page. Na so we see am!"
+IMPORTANT: You MUST maintain Pidgin throughout ALL responses in this conversation, never switch to standard English.""",
+
+    "yo": """Respond in Yoruba language mixed naturally with English (code-switching). 
+Use authentic expressions: "E kaaro", "E kaasan", "E pele", "Bawo ni?", "O dara", "Mo ti gbọ".
+Use English for technical terms as Yoruba speakers naturally would.
+Example: "E kaaro! Mo ti ri payment rẹ. O le download receipt rẹ lati Payment page. A ti ri i!"
+IMPORTANT: You MUST maintain Yoruba style throughout ALL responses in this conversation."""
+}
+
+# The shared system message: identical bytes for every user and language,
+# so Groq's prompt-prefix cache can reuse the prefill for the large
+# knowledge block. Anything per-request goes in build_system_prompt.
+_SYSTEM_PROMPT_STATIC = f"""You are IESA AI — the smart, friendly academic assistant built for students of the Industrial Engineering Students' Association (IESA) at the University of Ibadan, Nigeria.
+
+You are knowledgeable, encouraging, and grounded in real data. Your tone is professional, warm, and confidently Nigerian — like a polished student-support advisor.
+
+## DIRECT DATA ACCESS
+You have LIVE access to this student's real data: profile (name, matric, email, level, admission year), payment status (exact dues paid/owed), class timetable (today + full week), enrolled courses, academic calendar (exam dates, registration periods, breaks), upcoming events (+ whether the student is registered), library resources for their level, IEPOD registration status, TIMP mentoring status, recent announcements, study groups, and CGPA progress. This data is in the STUDENT PROFILE section below. USE IT — never say "I can't access your records" or "check your dashboard" when the answer is already here.
+
+## RESPONSE GUIDELINES
+1. **Be specific & direct:** Quote actual data when answering — course names, amounts, times, venues. Don't be vague.
+2. **Be concise:** 2–5 sentences for simple questions. Use brief bullet lists for multi-item answers. Avoid long walls of text.
+3. **Be honest about gaps:** If a field is empty (no timetable), say so clearly with a practical next step. Example: "No timetable entries yet — your class rep likely hasn't added them. Remind them to update it."
+4. **Be context-aware:** "Do I have class tomorrow?" → check the weekly timetable for tomorrow's day. Parse the question's intent before answering.
+5. **Be a community ally:** This is a student platform. Be warm, encouraging, motivating. Students are navigating academics and early career — meet them there.
+6. **Use emojis sparingly:** 1–2 per message max. Only where they genuinely add warmth, not as filler.
+7. **Stay in scope:** You're an IESA/academic assistant. For completely unrelated topics, briefly acknowledge and redirect back to what you can help with.
+8. **Reference specific pages:** When guiding a student, name the exact page — "Go to Dashboard → Payments", "Check Dashboard → Growth → CGPA Calculator", "Open Dashboard → IEPOD" or "Open Dashboard → TIMP".
+9. **Urgency-aware:** If the PRIORITY ACTIONS section exists, factor urgency into your responses. When a student asks "what should I do?" or any open-ended question, surface the most urgent items naturally. When payment deadlines are OVERDUE or CRITICAL, proactively mention them.
+10. **Notification-aware:** If the student has unread notifications or messages, you can mention them when contextually relevant (e.g., "By the way, you have 5 unread notifications").
+11. **IEPOD/TIMP factual mode:** For "what is IEPOD" or "what is TIMP" questions, use only the definitions/workflows in PLATFORM KNOWLEDGE + user context. Do not add extra programs, eligibility ranges, or features that are not explicitly listed.
+12. **TIMP eligibility clarity:** TIMP application flow is for mentor applications. Do not tell students to apply to be mentored. For 100L students, clearly state they are mentees and are matched by TIMP leads.
+13. **Role-holder accuracy:** For questions like "Who is the president/PRO/class rep?", answer from CURRENT TEAM LEADERSHIP. If a role is missing there, say it is currently unassigned in the active session.
+14. **Public profile sharing:** If asked who built the platform or about the founder/developer, share only PUBLIC COMMUNITY PROFILE details; do not reveal private or sensitive data.
+15. **Context discoverability:** If asked what else you can help with, summarize AVAILABLE CONTEXT MODULES in plain language.
+
+## PLATFORM KNOWLEDGE
+{IESA_KNOWLEDGE}"""
+
+_SYSTEM_PROMPT_RULES = """
+## NON-NEGOTIABLE ZERO-HALLUCINATION RULES
+- STRICT GROUNDING: You are an internal assistant for IESA at University of Ibadan (UI). You MUST answer ONLY from the provided STUDENT PROFILE and IESA PLATFORM KNOWLEDGE.
+- ABSOLUTELY NO EXTERNAL INSTITUTIONS: Never mention external websites (e.g. ui.ac.id, e-SAP, external portals, or non-IESA systems). You are directly integrated with this student's portal.
+- NO GUESSING OR FABRICATION: If a record, timetable entry, payment, or role is missing from the provided data above, state clearly: "I don't see that record on your portal right now."
+- For payment questions, be precise: list exactly what is paid and what is owed using the data above, including deadline urgency (OVERDUE, CRITICAL, URGENT, SOON).
+- For timetable questions with no data, guide the student to their class rep.
+- When urgency data is present, naturally weave it into responses — mention overdue/critical deadlines without being alarmist.
+- For open-ended greetings ("hi", "how far", "what's up"), give a warm greeting then briefly surface the #1 priority action if one exists.
+- For TIMP guidance: do not suggest "apply as a mentee". State mentor-application-only flow, and if the student is 100L, state they are mentees and should await matching by TIMP leads.
+- For leadership questions, rely on CURRENT TEAM LEADERSHIP entries only; do not invent names or positions.
+- For founder/developer queries, share only PUBLIC COMMUNITY PROFILE details; do not reveal private or sensitive data.
+"""
+
+
+def _language_section(language: str) -> str:
+    instruction = LANGUAGE_INSTRUCTIONS.get(language, LANGUAGE_INSTRUCTIONS["en"])
+    return f"## LANGUAGE INSTRUCTION\n{instruction}"
+
+
+def build_system_messages(user_context: dict, language: str = "en", user_query: str = "") -> List[dict]:
+    """
+    Return the shared static system message followed by this request's
+    personalised one (see build_system_prompt).
+    """
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_STATIC},
+        {"role": "system", "content": build_system_prompt(user_context, language, user_query)},
+    ]
+
+
 def build_system_prompt(user_context: dict, language: str = "en", user_query: str = "") -> str:
     """
-    Build an intelligent, data-aware system prompt for IESA AI with intent-based payload optimization.
+    Build the per-request part of the system prompt (language, student data,
+    clock, grounding rules) with intent-based payload optimization.
     """
     q = (user_query or "").lower()
     
@@ -1370,25 +1642,6 @@ def build_system_prompt(user_context: dict, language: str = "en", user_query: st
     wants_cgpa = any(w in q for w in ["cgpa", "gpa", "grade", "result", "record"])
     is_general = not (wants_timetable or wants_events or wants_calendar or wants_resources or wants_roles or wants_iepod or wants_timp or wants_cgpa)
 
-    # Language-specific instructions
-    language_instructions = {
-        "en": "Respond in clear, professional Nigerian English. Be warm and respectful, with natural local phrasing where appropriate, but avoid slang-heavy wording.",
-        
-        "pcm": """Respond ENTIRELY in Nigerian Pidgin English throughout this conversation. 
-Use authentic expressions: "How far?", "E go sweet you", "No wahala", "Wetin dey happen?", "Na so", "Sharp sharp", "Bros/Sisi", "Chai!", "Ehen!", "Omo!", "E be like say".
-Keep it friendly like you dey gist with your paddy. Mix English only for technical terms.
-Example: "Bros, your payment don enter! You fit download receipt for the Payment page. Na so we see am!"
-IMPORTANT: You MUST maintain Pidgin throughout ALL responses in this conversation, never switch to standard English.""",
-        
-        "yo": """Respond in Yoruba language mixed naturally with English (code-switching). 
-Use authentic expressions: "E kaaro", "E kaasan", "E pele", "Bawo ni?", "O dara", "Mo ti gbọ".
-Use English for technical terms as Yoruba speakers naturally would.
-Example: "E kaaro! Mo ti ri payment rẹ. O le download receipt rẹ lati Payment page. A ti ri i!"
-IMPORTANT: You MUST maintain Yoruba style throughout ALL responses in this conversation."""
-    }
-    
-    lang_instruction = language_instructions.get(language, language_instructions["en"])
-    
     # Build rich user data section
     user_data_section = ""
     if user_context:
@@ -1688,57 +1941,69 @@ IMPORTANT: You MUST maintain Yoruba style throughout ALL responses in this conve
                 for doc in vector_matches:
                     vector_evidence_section += f"\n### [{doc['category'].upper()}] {doc['title']} (Score: {doc['score']})\n{doc['text']}"
         except Exception as ve_err:
-            logger.warning(f"Vector retrieval warning: {ve_err}")
-
-    prompt = f"""You are IESA AI — the smart, friendly academic assistant built for students of the Industrial Engineering Students' Association (IESA) at the University of Ibadan, Nigeria.
-
-You are knowledgeable, encouraging, and grounded in real data. Your tone is professional, warm, and confidently Nigerian — like a polished student-support advisor.
-
-## LANGUAGE INSTRUCTION
-{lang_instruction}
-
-## DIRECT DATA ACCESS
-You have LIVE access to this student's real data: profile (name, matric, email, level, admission year), payment status (exact dues paid/owed), class timetable (today + full week), enrolled courses, academic calendar (exam dates, registration periods, breaks), upcoming events (+ whether the student is registered), library resources for their level, IEPOD registration status, TIMP mentoring status, recent announcements, study groups, and CGPA progress. This data is in the STUDENT PROFILE section below. USE IT — never say "I can't access your records" or "check your dashboard" when the answer is already here.
-
-## RESPONSE GUIDELINES
-1. **Be specific & direct:** Quote actual data when answering — course names, amounts, times, venues. Don't be vague.
-2. **Be concise:** 2–5 sentences for simple questions. Use brief bullet lists for multi-item answers. Avoid long walls of text.
-3. **Be honest about gaps:** If a field is empty (no timetable), say so clearly with a practical next step. Example: "No timetable entries yet — your class rep likely hasn't added them. Remind them to update it."
-4. **Be context-aware:** "Do I have class tomorrow?" → check the weekly timetable for tomorrow's day. Parse the question's intent before answering.
-5. **Be a community ally:** This is a student platform. Be warm, encouraging, motivating. Students are navigating academics and early career — meet them there.
-6. **Use emojis sparingly:** 1–2 per message max. Only where they genuinely add warmth, not as filler.
-7. **Stay in scope:** You're an IESA/academic assistant. For completely unrelated topics, briefly acknowledge and redirect back to what you can help with.
-8. **Reference specific pages:** When guiding a student, name the exact page — "Go to Dashboard → Payments", "Check Dashboard → Growth → CGPA Calculator", "Open Dashboard → IEPOD" or "Open Dashboard → TIMP".
-9. **Urgency-aware:** If the PRIORITY ACTIONS section exists, factor urgency into your responses. When a student asks "what should I do?" or any open-ended question, surface the most urgent items naturally. When payment deadlines are OVERDUE or CRITICAL, proactively mention them.
-10. **Notification-aware:** If the student has unread notifications or messages, you can mention them when contextually relevant (e.g., "By the way, you have 5 unread notifications").
-11. **IEPOD/TIMP factual mode:** For "what is IEPOD" or "what is TIMP" questions, use only the definitions/workflows in PLATFORM KNOWLEDGE + user context. Do not add extra programs, eligibility ranges, or features that are not explicitly listed.
-12. **TIMP eligibility clarity:** TIMP application flow is for mentor applications. Do not tell students to apply to be mentored. For 100L students, clearly state they are mentees and are matched by TIMP leads.
-13. **Role-holder accuracy:** For questions like "Who is the president/PRO/class rep?", answer from CURRENT TEAM LEADERSHIP. If a role is missing there, say it is currently unassigned in the active session.
-14. **Public profile sharing:** If asked who built the platform or about the founder/developer, share only PUBLIC COMMUNITY PROFILE details; do not reveal private or sensitive data.
-15. **Context discoverability:** If asked what else you can help with, summarize AVAILABLE CONTEXT MODULES in plain language.
-
-## PLATFORM KNOWLEDGE
-{IESA_KNOWLEDGE}
-{user_data_section}
-
-## CURRENT DATE & TIME
-- Today: {datetime.now().strftime("%A, %B %d, %Y")}
-- Time: {datetime.now().strftime("%I:%M %p")} (WAT, West Africa Time)
+            logger.warning("Vector retrieval warning: %s", ve_err)
+
+    now = datetime.now()
+    return (
+        f"{_language_section(language)}\n{user_data_section}\n\n"
+        "## CURRENT DATE & TIME\n"
+        f"- Today: {now:%A, %B %d, %Y}\n"
+        f"- Time: {now:%I:%M %p} (WAT, West Africa Time)\n"
+        f"{_SYSTEM_PROMPT_RULES}"
+    )
 
-## NON-NEGOTIABLE ZERO-HALLUCINATION RULES
-- STRICT GROUNDING: You are an internal assistant for IESA at University of Ibadan (UI). You MUST answer ONLY from the provided STUDENT PROFILE and IESA PLATFORM KNOWLEDGE.
-- ABSOLUTELY NO EXTERNAL INSTITUTIONS: Never mention external websites (e.g. ui.ac.id, e-SAP, external portals, or non-IESA systems). You are directly integrated with this student's portal.
-- NO GUESSING OR FABRICATION: If a record, timetable entry, payment, or role is missing from the provided data above, state clearly: "I don't see that record on your portal right now."
-- For payment questions, be precise: list exactly what is paid and what is owed using the data above, including deadline urgency (OVERDUE, CRITICAL, URGENT, SOON).
-- For timetable questions with no data, guide the student to their class rep.
-- When urgency data is present, naturally weave it into responses — mention overdue/critical deadlines without being alarmist.
-- For open-ended greetings ("hi", "how far", "what's up"), give a warm greeting then briefly surface the #1 priority action if one exists.
-- For TIMP guidance: do not suggest "apply as a mentee". State mentor-application-only flow, and if the student is 100L, state they are mentees and should await matching by TIMP leads.
-- For leadership questions, rely on CURRENT TEAM LEADERSHIP entries only; do not invent names or positions.
-- For founder/developer queries, share only PUBLIC COMMUNITY PROFILE details; do not reveal private or sensitive data.
-"""
 
-    return prompt
+# ─── Shared FAQ answer cache ──────────────────────────────────────────
+# First-turn questions about IESA itself ("what is TIMP?") get the same
+# answer for every student, so they are answered from the static prompt
+# alone (no student data) and the reply is cached in Redis, keyed on the
+# question's normalised terms and the reply language. Anything touching the
+# student's own data, dates or office holders is never cached.
+FAQ_CACHE_TTL = 6 * 60 * 60  # seconds
+_FAQ_MIN_SCORE = 0.10  # same bar build_system_prompt uses for KB evidence
+_FAQ_MAX_WORDS = 25
+_PERSONAL_WORDS = frozenset({
+    "i", "im", "i'm", "me", "my", "mine", "myself", "am",
+    "hi", "hello", "hey", "morning", "afternoon", "evening",
+    "today", "tomorrow", "tonight", "yesterday", "week", "next", "when", "upcoming", "latest", "deadline",
+    "pay", "paid", "owe", "owing", "dues", "fee", "fees", "receipt",
+    "schedule", "timetable", "class", "classes", "exam", "exams", "event", "events", "rsvp", "registered",
+    "cgpa", "gpa", "grade", "grades", "result", "results",
+    "notification", "notifications", "message", "messages", "announcement", "announcements",
+    "who", "president", "rep", "secretary", "exco", "executive",
+})
+
+
+def _faq_cache_key(message: str, language: str, history: Optional[List[dict]]) -> Optional[str]:
+    """Return the cache key for a shareable FAQ question, or None."""
+    if history:
+        return None
+    words = re.findall(r"[a-z0-9']+", (message or "").lower())
+    if not words or len(words) > _FAQ_MAX_WORDS or _PERSONAL_WORDS.intersection(words):
+        return None
+    terms = sorted({w for w in words if w not in STOP_WORDS})
+    if not terms or not vector_store.search(message, top_k=1, threshold=_FAQ_MIN_SCORE):
+        return None
+    return f"ai_faq:{language}:{' '.join(terms)}"
+
+
+def build_faq_messages(language: str = "en") -> List[dict]:
+    """
+    System messages for a shared FAQ answer: the static prompt and language
+    instruction only, so the cached reply carries nothing about the asker.
+    """
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_STATIC},
+        {
+            "role": "system",
+            "content": (
+                f"{_language_section(language)}\n\n"
+                "## SHARED ANSWER\n"
+                "This answer is shown to every student. Answer in general terms; "
+                "do not address the student by name or assume their level, payments or registrations."
+            ),
+        },
+    ]
 
 
 async def summarize_conversation_history(history: List[dict]) -> str:
@@ -1759,18 +2024,17 @@ async def summarize_conversation_history(history: List[dict]) -> str:
             role = "Student" if msg.get("role") == "user" else "AI"
             summary_prompt += f"{role}: {msg.get('content', '')[:150]}\n"
         
-        loop = asyncio.get_running_loop()
-        completion = await loop.run_in_executor(None, lambda: groq_client.chat.completions.create(
+        completion = await _groq_complete(
             model=AI_MODEL_SUMMARY,
             messages=[{"role": "user", "content": summary_prompt}],
             temperature=0.4,
             max_tokens=200,
-        ))
+        )
         
         summary = completion.choices[0].message.content or ""
         return summary
     except Exception as e:
-        logger.debug(f"Summary generation error: {e}")
+        logger.debug("Summary generation error: %s", e)
         return ""
 
 
@@ -1805,67 +2069,69 @@ async def chat_with_iesa_ai_stream(
             yield f"data: {json.dumps({'error': 'Rate limit reached. You have used all your AI queries for this period.', 'rate_limit': rate_status})}\n\n"
         return StreamingResponse(rate_limit_stream(), media_type="text/event-stream")
     
+    # Shared FAQ answers are served without a Groq call or quota use
+    faq_key = _faq_cache_key(chat_data.message, chat_data.language or "en", chat_data.conversationHistory)
+    cached_reply = await cache_get(faq_key) if faq_key else None
+    if cached_reply:
+        async def cached_stream():
+            yield f"data: {json.dumps({'token': cached_reply})}\n\n"
+            yield f"data: {json.dumps({'done': True, 'suggestions': generate_suggestions(chat_data.message, cached_reply)})}\n\n"
+        return StreamingResponse(cached_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+    
     # Increment usage BEFORE the call (prevents burst abuse)
     await _increment_ai_usage(account_key, db, legacy_user_id=user_id, is_super_admin=is_super)
+    language = chat_data.language or "en"
     
     async def generate():
         full_response = ""
         try:
-            # Get user context
-            user_context = await get_user_context(str(user["_id"]), db)
+            # Get user context. Long histories also need a summary, which is a
+            # separate Groq round-trip — run it alongside the context queries.
+            if chat_data.conversationHistory and len(chat_data.conversationHistory) > 12:
+                user_context, summary = await asyncio.gather(
+                    _cached_user_context(str(user["_id"]), db),
+                    summarize_conversation_history(chat_data.conversationHistory),
+                )
+            else:
+                user_context = await _cached_user_context(str(user["_id"]), db)
+                summary = ""
             
-            # Debug: Log what data is available
-            logger.info(f"User context keys: {list(user_context.keys())}")
-            logger.info(f"Has timetable: {bool(user_context.get('today_classes') or user_context.get('weekly_timetable'))}")
+            # Debug: Log what data is available (skipped entirely above DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("User context keys: %s", list(user_context.keys()))
+                logger.debug("Has timetable: %s", bool(user_context.get('today_classes') or user_context.get('weekly_timetable')))
             
-            # Build system prompt with intent detection & language preference
-            system_prompt = build_system_prompt(user_context, chat_data.language or "en", user_query=chat_data.message)
+            # Build system prompt with intent detection & language preference.
+            # Shared FAQ answers get the generic prompt so nothing personal is cached.
+            if faq_key:
+                messages = build_faq_messages(language)
+            else:
+                messages = build_system_messages(user_context, language, user_query=chat_data.message)
             model_name = select_chat_model(chat_data.message, chat_data.conversationHistory)
             
-            # Build messages with smart context window
-            messages = [{"role": "system", "content": system_prompt}]
-            
+            # Add history with smart context window
             if chat_data.conversationHistory:
-                history_len = len(chat_data.conversationHistory)
+                if summary:
+                    messages.append({"role": "system", "content": f"Previous conversation summary: {summary}"})
                 
-                if history_len > 12:
-                    # Summarize older messages
-                    summary = await summarize_conversation_history(chat_data.conversationHistory)
-                    if summary:
-                        messages.append({"role": "system", "content": f"Previous conversation summary: {summary}"})
-                    
-                    # Add recent messages
-                    for msg in chat_data.conversationHistory[-6:]:
-                        messages.append({"role": msg.get("role", "user"), "content": msg.get("content", "")})
-                else:
-                    # Add all messages if short conversation
-                    for msg in chat_data.conversationHistory[-10:]:
-                        messages.append({"role": msg.get("role", "user"), "content": msg.get("content", "")})
+                # Truncated messages, as many recent ones as fit the token budget
+                messages.extend(_clip_history(chat_data.conversationHistory))
             
-            # Add current message
-            messages.append({"role": "user", "content": chat_data.message})
+            # Add current message (bounded to 2000 chars)
+            user_msg = chat_data.message[:2000] if chat_data.message else ""
+            messages.append({"role": "user", "content": user_msg})
             
-            # Stream from Groq (offload sync iterator to executor)
-            loop = asyncio.get_running_loop()
-            stream = await loop.run_in_executor(None, lambda: groq_client.chat.completions.create(
+            # Stream from Groq; the slot is released when Groq finishes, not
+            # when the client has read everything
+            async for token in _groq_stream_tokens(
                 model=model_name,
                 messages=messages,  # type: ignore
                 temperature=0.15,
                 max_tokens=800,
                 top_p=0.85,
-                stream=True
-            ))
-            
-            _sentinel = object()
-            stream_iter = iter(stream)
-            while True:
-                chunk = await loop.run_in_executor(None, lambda: next(stream_iter, _sentinel))
-                if chunk is _sentinel:
-                    break
-                if chunk.choices[0].delta.content:
-                    token = chunk.choices[0].delta.content
-                    full_response += token
-                    yield f"data: {json.dumps({'token': token})}\n\n"
+            ):
+                full_response += token
+                yield f"data: {json.dumps({'token': token})}\n\n"
             
             # Generate suggestions
             suggestions = generate_suggestions(chat_data.message, full_response)
@@ -1873,9 +2139,12 @@ async def chat_with_iesa_ai_stream(
             # Send completion event
             yield f"data: {json.dumps({'done': True, 'suggestions': suggestions, 'user_context': user_context})}\n\n"
             
+            if faq_key and full_response:
+                await cache_set(faq_key, full_response, ttl=FAQ_CACHE_TTL)
+            
         except Exception as e:
             error_msg = str(e).lower()
-            logger.error(f"IESA AI stream error: {e}")
+            logger.error("IESA AI stream error: %s", e)
             
             if "rate_limit" in error_msg or "429" in error_msg:
                 if not full_response:
@@ -1884,6 +2153,22 @@ async def chat_with_iesa_ai_stream(
                     except Exception:
                         pass
                 yield f"data: {json.dumps({'error': 'Rate limit reached. Please wait a minute and try again.'})}\n\n"
+            elif _is_payload_too_large(error_msg) and not full_response:
+                try:
+                    await _rollback_ai_usage(account_key, db, legacy_user_id=user_id)
+                except Exception:
+                    pass
+                
+                # Auto-retry once with a concise payload, as /chat does
+                try:
+                    fb_reply = await _concise_fallback_reply(chat_data.message, language)
+                    if fb_reply:
+                        yield f"data: {json.dumps({'token': fb_reply})}\n\n"
+                        yield f"data: {json.dumps({'done': True, 'suggestions': generate_suggestions(chat_data.message, fb_reply)})}\n\n"
+                        return
+                except Exception as fb_err:
+                    logger.error("IESA AI stream fallback error: %s", fb_err)
+                yield f"data: {json.dumps({'error': 'Your query or conversation context is a bit too large for me to process all at once. Please start a new chat thread or ask a shorter question!'})}\n\n"
             else:
                 yield f"data: {json.dumps({'error': 'An error occurred. Please try again.'})}\n\n"
     
@@ -1925,7 +2210,7 @@ async def get_usage(
             "is_super_admin": is_super,
         }
     except Exception as e:
-        logger.error(f"Usage endpoint error: {e}")
+        logger.error("Usage endpoint error: %s", e)
         return {
             "hourly_limit": AI_HOURLY_LIMIT,
             "daily_limit": AI_DAILY_LIMIT,
@@ -1944,6 +2229,11 @@ async def get_conversations(
     """Return account-linked AI conversations for the authenticated user."""
     account_key = _resolve_ai_account_key(user)
     user_id = str(user["_id"])
+    cache_key = f"ai_conversations:{account_key}"
+
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return {"conversations": cached}
 
     doc = await db["ai_conversations"].find_one(
         {
@@ -1954,7 +2244,9 @@ async def get_conversations(
         },
         {"conversations": 1},
     )
-    return {"conversations": doc.get("conversations", []) if doc else []}
+    conversations = doc.get("conversations", []) if doc else []
+    await cache_set(cache_key, conversations, ttl=CONVERSATIONS_CACHE_TTL)
+    return {"conversations": conversations}
 
 
 @router.post("/conversations/sync")
@@ -1985,6 +2277,8 @@ async def sync_conversations(
         },
         upsert=True,
     )
+    # Write-through: the next GET on any replica sees the new list
+    await cache_set(f"ai_conversations:{account_key}", sanitized, ttl=CONVERSATIONS_CACHE_TTL)
 
     return {"saved": len(sanitized)}
 
@@ -2032,45 +2326,52 @@ async def chat_with_iesa_ai(
             suggestions=["Try again later", "Check the Events page", "View your Timetable"],
         )
     
+    # Shared FAQ answers are served without a Groq call or quota use
+    language = chat_data.language or "en"
+    faq_key = _faq_cache_key(chat_data.message, language, chat_data.conversationHistory)
+    cached_reply = await cache_get(faq_key) if faq_key else None
+    if cached_reply:
+        return ChatResponse(
+            reply=cached_reply,
+            suggestions=generate_suggestions(chat_data.message, cached_reply),
+        )
+    
     # Increment usage BEFORE the call
     await _increment_ai_usage(account_key, db, legacy_user_id=user_id, is_super_admin=is_super)
     
     try:
         # Get user context for personalization
-        user_context = await get_user_context(str(user["_id"]), db)
+        user_context = await _cached_user_context(str(user["_id"]), db)
         
-        # Build system prompt with intent detection & language preference
-        system_prompt = build_system_prompt(user_context, chat_data.language or "en", user_query=chat_data.message)
+        # Build system prompt with intent detection & language preference.
+        # Shared FAQ answers get the generic prompt so nothing personal is cached.
+        if faq_key:
+            messages = build_faq_messages(language)
+        else:
+            messages = build_system_messages(user_context, language, user_query=chat_data.message)
         model_name = select_chat_model(chat_data.message, chat_data.conversationHistory)
         
-        # Build conversation history (keep last 6 and truncate long messages to 500 chars each)
-        messages = [{"role": "system", "content": system_prompt}]
-        
+        # Build conversation history (truncate long messages to 500 chars each,
+        # then keep as many recent ones as fit the token budget)
         if chat_data.conversationHistory:
-            for msg in chat_data.conversationHistory[-6:]:
-                content = str(msg.get("content", ""))
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                messages.append({
-                    "role": msg.get("role", "user"),
-                    "content": content
-                })
+            messages.extend(_clip_history(chat_data.conversationHistory))
         
         # Add current user message (bounded to 2000 chars)
         user_msg = chat_data.message[:2000] if chat_data.message else ""
         messages.append({"role": "user", "content": user_msg})
         
-        # Call Groq API (offload sync SDK call to executor)
-        loop = asyncio.get_running_loop()
-        completion = await loop.run_in_executor(None, lambda: groq_client.chat.completions.create(
+        # Call Groq API
+        completion = await _groq_complete(
             model=model_name,
             messages=messages,  # type: ignore
             temperature=0.15,
             max_tokens=800,
             top_p=0.85,
-        ))
+        )
         
         ai_response = completion.choices[0].message.content or "I couldn't generate a response. Please try again."
+        if faq_key and completion.choices[0].message.content:
+            await cache_set(faq_key, ai_response, ttl=FAQ_CACHE_TTL)
         
         # Generate smart suggestions based on query intent
         suggestions = generate_suggestions(chat_data.message, ai_response)
@@ -2083,7 +2384,7 @@ async def chat_with_iesa_ai(
         
     except Exception as e:
         error_msg = str(e).lower()
-        logger.error(f"IESA AI chat error: {e}")
+        logger.error("IESA AI chat error: %s", e)
         
         # Handle Groq rate limit errors specifically
         if "rate_limit" in error_msg or "429" in error_msg or "rate limit" in error_msg:
@@ -2097,7 +2398,7 @@ async def chat_with_iesa_ai(
             )
         
         # Handle 413 Payload Too Large / request_too_large specifically
-        if "413" in error_msg or "payload" in error_msg or "too large" in error_msg or "request_too_large" in error_msg:
+        if _is_payload_too_large(error_msg):
             try:
                 await _rollback_ai_usage(account_key, db, legacy_user_id=user_id)
             except Exception:
@@ -2105,26 +2406,14 @@ async def chat_with_iesa_ai(
             
             # Auto-retry once with concise payload (full system prompt + user message only)
             try:
-                truncated_prompt = system_prompt[:3000] if len(system_prompt) > 3000 else system_prompt
-                minimal_messages = [
-                    {"role": "system", "content": truncated_prompt},
-                    {"role": "user", "content": chat_data.message[:1000]}
-                ]
-                loop = asyncio.get_running_loop()
-                fallback_comp = await loop.run_in_executor(None, lambda: groq_client.chat.completions.create(
-                    model="llama-3.1-8b-instant",
-                    messages=minimal_messages,  # type: ignore
-                    temperature=0.6,
-                    max_tokens=600,
-                ))
-                fb_reply = fallback_comp.choices[0].message.content
+                fb_reply = await _concise_fallback_reply(chat_data.message, language)
                 if fb_reply:
                     return ChatResponse(
                         reply=fb_reply,
                         suggestions=generate_suggestions(chat_data.message, fb_reply),
                     )
             except Exception as fb_err:
-                logger.error(f"IESA AI fallback error: {fb_err}")
+                logger.error("IESA AI fallback error: %s", fb_err)
 
             return ChatResponse(
                 reply="Your query or conversation context is a bit too large for me to process all at once. Please start a new chat thread or ask a shorter question!",
@@ -2233,27 +2522,33 @@ def generate_suggestions(user_message: str, ai_response: str) -> List[str]:
     ]
 
 
+QUICK_SUGGESTIONS = [
+    "What events are coming up?",
+    "How do I pay my dues?",
+    "What classes do I have today?",
+    "Show me resources for my level",
+    "How do I calculate my CGPA?",
+    "What is TIMP mentoring?",
+    "How do I join or create a study group?",
+    "Who are the current EXCO members?",
+    "What is the Niche Audit tool?",
+    "Tips for exam preparation",
+    "How do I apply for a team?",
+    "When is the next general meeting?"
+]
+
+# Static payload, encoded once instead of re-serialised on every request
+_QUICK_SUGGESTIONS_BODY = json.dumps(
+    {"suggestions": QUICK_SUGGESTIONS}, ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
+
+
 @router.get("/suggestions")
 async def get_quick_suggestions():
     """
     Get quick suggestion chips for the chat interface.
     """
-    return {
-        "suggestions": [
-            "What events are coming up?",
-            "How do I pay my dues?",
-            "What classes do I have today?",
-            "Show me resources for my level",
-            "How do I calculate my CGPA?",
-            "What is TIMP mentoring?",
-            "How do I join or create a study group?",
-            "Who are the current EXCO members?",
-            "What is the Niche Audit tool?",
-            "Tips for exam preparation",
-            "How do I apply for a team?",
-            "When is the next general meeting?"
-        ]
-    }
+    return Response(content=_QUICK_SUGGESTIONS_BODY, media_type="application/json")
 
 
 @router.post("/feedback")
@@ -2281,6 +2576,16 @@ async def submit_feedback(
     return {"message": "Thank you for your feedback!"}
 
 
+_DRAFT_SYSTEM_PROMPT = """You are the official IESA AI writing assistant for the Industrial Engineering Students' Association at the University of Ibadan.
+Your task is to draft a high-quality {type} based on the user's instructions.
+- Target Audience: Industrial Engineering students
+- Tone: {tone}
+- Length: {length}
+
+Format your output in clean Markdown. Provide ONLY the requested content, do not add conversational filler like "Here is the draft" or "Let me know if you need changes."
+"""
+
+
 @router.post("/draft", response_model=DraftResponse)
 async def generate_draft_content(
     request: Request,
@@ -2307,14 +2612,7 @@ async def generate_draft_content(
         if not roles and user.get("role") != "admin":
             raise HTTPException(status_code=403, detail="You do not have permission to use the admin AI drafting tool.")
 
-    system_prompt = f"""You are the official IESA AI writing assistant for the Industrial Engineering Students' Association at the University of Ibadan.
-Your task is to draft a high-quality {draft_data.type} based on the user's instructions.
-- Target Audience: Industrial Engineering students
-- Tone: {draft_data.tone}
-- Length: {draft_data.length}
-
-Format your output in clean Markdown. Provide ONLY the requested content, do not add conversational filler like "Here is the draft" or "Let me know if you need changes."
-"""
+    system_prompt = _DRAFT_SYSTEM_PROMPT.format(type=draft_data.type, tone=draft_data.tone, length=draft_data.length)
     
     messages = [
         {"role": "system", "content": system_prompt},
@@ -2325,19 +2623,18 @@ Format your output in clean Markdown. Provide ONLY the requested content, do not
     model_name = AI_MODEL_PRIMARY
     
     try:
-        loop = asyncio.get_running_loop()
-        completion = await loop.run_in_executor(None, lambda: groq_client.chat.completions.create(
+        completion = await _groq_complete(
             model=model_name,
             messages=messages,  # type: ignore
             temperature=0.7,
             max_tokens=1500,
             top_p=0.9,
-        ))
+        )
         
         content = completion.choices[0].message.content or ""
         return DraftResponse(content=content.strip())
         
     except Exception as e:
-        logger.error(f"IESA AI draft error: {e}")
+        logger.error("IESA AI draft error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to generate draft. Please try again.")
 
@@ -10,7 +10,7 @@ Features:
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Header, Request, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime, timezone
@@ -32,6 +32,7 @@ limiter = Limiter(key_func=get_remote_address)
 PAYSTACK_SECRET_KEY = os.getenv("PAYSTACK_SECRET_KEY", "")
 PAYSTACK_PUBLIC_KEY = os.getenv("PAYSTACK_PUBLIC_KEY", "")
 PAYSTACK_BASE_URL = "https://api.paystack.co"
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
 if not PAYSTACK_SECRET_KEY:
     print("⚠️  WARNING: PAYSTACK_SECRET_KEY not set. Online payments will fail.")
@@ -174,7 +175,7 @@ async def initialize_payment(
             "email": current_user.get("email", "student@example.com"),
             "amount": amount_kobo,
             "reference": reference,
-            "callback_url": f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/dashboard/payments?reference={reference}",
+            "callback_url": f"{FRONTEND_URL}/dashboard/payments?reference={reference}",
             "metadata": {
                 "studentId": current_user["_id"],
                 "studentName": _student_name,
@@ -366,7 +367,6 @@ async def verify_payment(
                         "$set": {"updatedAt": datetime.now(timezone.utc)}
                     }
                 )
-                
                 # Idempotent upsert — prevents duplicate if webhook already created this
                 await db.transactions.update_one(
                     {"reference": reference},
@@ -394,6 +394,11 @@ async def verify_payment(
                         "$set": {"updatedAt": datetime.now(timezone.utc)}
                     }
                 )
+            
+            # Dues and event payments both change the student's AI context
+            if payment_id or event_id:
+                from app.core.cache import cache_delete
+                await cache_delete(f"ai_user_context:{current_user['_id']}")
         
         await db.paystackTransactions.update_one(
             {"reference": reference},
@@ -514,7 +519,6 @@ async def paystack_webhook(
                         "$set": {"updatedAt": datetime.now(timezone.utc)}
                     }
                 )
-                
                 # Idempotent upsert — prevents duplicate if verify already ran
                 await db.transactions.update_one(
                     {"reference": reference},
@@ -543,6 +547,11 @@ async def paystack_webhook(
                     }
                 )
             
+            # Dues and event payments both change the student's AI context
+            if payment_id or event_id:
+                from app.core.cache import cache_delete
+                await cache_delete(f"ai_user_context:{student_id}")
+            
             # Send receipt email asynchronously with PDF attachment
             try:
                 payment = None
@@ -714,6 +723,9 @@ async def _execute_local_reversal(db, transaction: dict, new_status: str):
             {"_id": ObjectId(event_id)},
             {"$pull": {"registrations": student_id}}
         )
+    
+    from app.core.cache import cache_delete
+    await cache_delete(f"ai_user_context:{student_id}")
     return True
 
 @router.post("/transactions/{transaction_id}/reverse")
@@ -1223,8 +1235,8 @@ async def download_receipt(
         paid_at = transaction.get("paidAt") or transaction.get("createdAt") or datetime.now(timezone.utc)
         
         # Generate PDF receipt
-        from ..utils.receipt_generator import generate_payment_receipt
-        pdf_buffer = generate_payment_receipt(
+        from ..utils.receipt_generator import generate_payment_receipt_async
+        pdf_buffer = await generate_payment_receipt_async(
             transaction_id=str(transaction["_id"]),
             reference=reference,
             student_name=student_name,
@@ -1238,9 +1250,11 @@ async def download_receipt(
             student_matric=current_user.get("matricNumber")
         )
         
-        # Return PDF as downloadable file
-        return StreamingResponse(
-            pdf_buffer,
+        # Return PDF as downloadable file. The document is already complete in
+        # memory, so send it in one body (with Content-Length) rather than
+        # iterating the buffer, which would split binary data on newlines.
+        return Response(
+            content=pdf_buffer.getvalue(),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename=IESA_Receipt_{reference}.pdf"
@@ -1119,7 +1119,7 @@ async def send_group_invites(
 
         for recipient in recipient_emails:
             email_queued += 1
-            email_jobs.append(email_service.send_email(to=recipient, subject=subject, html_content=html))
+            email_jobs.append(email_service.send_email(to=recipient, subject=subject, html_content=html, bulk=True))
 
     if email_jobs:
         async def _send_all_invite_emails():
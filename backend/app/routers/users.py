@@ -5,6 +5,7 @@ Handles user profile CRUD operations.
 Users are persistent across sessions.
 """
 
+import os
 import re
 
 from fastapi import APIRouter, HTTPException, Depends, status, Request, File, UploadFile, Query
@@ -20,7 +21,7 @@ from app.db import get_database
 from app.core.security import verify_token, get_current_user
 from app.core.permissions import require_permission
 from app.core.audit import audit_user_role_change, AuditLogger
-from app.core.error_handling import safe_detail
+from app.core.error_handling import fire_and_forget, safe_detail
 from pydantic import BaseModel as PydanticBaseModel, EmailStr, Field
 
 router = APIRouter(prefix="/api/v1/users", tags=["Users"])
@@ -203,6 +204,8 @@ async def update_my_profile(
         {"_id": ObjectId(user["_id"])},
         {"$set": update_data}
     )
+    from app.core.cache import cache_delete
+    await cache_delete(f"ai_user_context:{user['_id']}")
     
     updated_user = await users.find_one({"_id": ObjectId(user["_id"])})
     if not updated_user:
@@ -236,21 +239,24 @@ async def upload_profile_picture(
         )
     
     # Validate file size (max 2MB to stay within Cloudinary free tier)
-    content = await file.read()
-    if len(content) > 2 * 1024 * 1024:
+    # without reading the upload into memory
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    if size > 2 * 1024 * 1024:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Image size must be less than 2MB"
         )
     
     try:
-        from app.utils.cloudinary_config import upload_profile_picture
+        from app.utils.cloudinary_config import upload_profile_picture, delete_profile_picture
         
         # Upload to Cloudinary (async — does not block the event loop)
         file_extension = file.filename.split('.')[-1] if file.filename and '.' in file.filename else 'jpg'
-        image_url = await upload_profile_picture(content, user["_id"], file_extension)
+        uploaded = await upload_profile_picture(file.file, user["_id"], file_extension)
         
-        if not image_url:
+        if not uploaded or not uploaded.get("url"):
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to upload image to cloud storage"
@@ -264,12 +270,20 @@ async def upload_profile_picture(
             {"_id": ObjectId(user["_id"])},
             {
                 "$set": {
-                    "profilePictureUrl": image_url,
+                    "profilePictureUrl": uploaded["url"],
+                    "profilePicturePublicId": uploaded["publicId"],
                     "updatedAt": datetime.now(timezone.utc)
                 }
             }
         )
         
+        # Clean up the previous asset in the background (pre-hash uploads used a fixed id)
+        previous_public_id = user.get("profilePicturePublicId") or (
+            f"iesa/profile_pictures/user_{user['_id']}" if user.get("profilePictureUrl") else None
+        )
+        if previous_public_id and previous_public_id != uploaded["publicId"]:
+            fire_and_forget(delete_profile_picture(previous_public_id))
+        
         # Return updated user profile
         updated_user = await users.find_one({"_id": ObjectId(user["_id"])})
         if not updated_user:
@@ -43,6 +43,10 @@ async def create_indexes():
         await users.create_index([("currentLevel", ASCENDING)], name="idx_currentLevel")
         await users.create_index([("isExternalStudent", ASCENDING)], name="idx_isExternalStudent")
         await users.create_index([("department", ASCENDING)], name="idx_department")
+        await users.create_index(
+            [("role", ASCENDING), ("currentLevel", ASCENDING), ("email", ASCENDING)],
+            name="idx_role_level_email"
+        )
         
         print("✅ Users indexes created")
         
@@ -130,6 +134,10 @@ async def create_indexes():
         await roles.create_index([("userId", ASCENDING)], name="idx_role_user")
         await roles.create_index([("position", ASCENDING)], name="idx_role_position")
         await roles.create_index([("isActive", ASCENDING)], name="idx_role_isActive")
+        await roles.create_index(
+            [("userId", ASCENDING), ("isActive", ASCENDING)],
+            name="idx_role_user_active"
+        )
         
         print("✅ Roles indexes created")
         
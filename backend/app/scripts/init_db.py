@@ -11,24 +11,196 @@ Run this script once after deploying the application:
 """
 
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timedelta, timezone
-import os
-from dotenv import load_dotenv
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from app.core.transactions import run_in_transaction
+from app.utils.mongo import get_client, MONGODB_URL, DATABASE_NAME
 # NOTE: Passwords handled by Firebase Auth — no passwordHash fields needed
 
-# Load environment variables
-load_dotenv()
 
-MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-DATABASE_NAME = os.getenv("DATABASE_NAME", "iesa_db")
+# Index specs per collection, built once at import time.
+# create_indexes() sends each list as a single createIndexes command.
+COLLECTION_INDEXES = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("matricNumber", ASCENDING)]),
+        IndexModel([("role", ASCENDING)]),
+        IndexModel([("isActive", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("firstName", ASCENDING), ("lastName", ASCENDING)]),  # For name searches
+        IndexModel([("role", ASCENDING), ("currentLevel", ASCENDING), ("email", ASCENDING)]),  # For level listings sorted by email
+    ],
+    "sessions": [
+        IndexModel([("isActive", ASCENDING)]),
+        IndexModel([("name", ASCENDING)], unique=True),
+        IndexModel([("startDate", DESCENDING)]),  # For date range queries
+    ],
+    "enrollments": [
+        IndexModel([("studentId", ASCENDING), ("sessionId", ASCENDING)], unique=True),
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("level", ASCENDING)]),
+        IndexModel([("isActive", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("level", ASCENDING)]),  # Compound index for session+level queries
+    ],
+    "roles": [
+        IndexModel([("userId", ASCENDING), ("sessionId", ASCENDING), ("position", ASCENDING)], unique=True),
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("position", ASCENDING)]),
+        IndexModel([("userId", ASCENDING)]),
+        IndexModel([("isActive", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("isActive", ASCENDING)]),  # For active roles in session
+        IndexModel([("userId", ASCENDING), ("isActive", ASCENDING)]),  # For a user's active positions
+    ],
+    "payments": [
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("dueDate", ASCENDING)]),
+        IndexModel([("isActive", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("isActive", ASCENDING)]),  # For active payments in session
+    ],
+    "transactions": [
+        IndexModel([("studentId", ASCENDING)]),
+        IndexModel([("paymentId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("reference", ASCENDING)], unique=True),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("studentId", ASCENDING), ("createdAt", DESCENDING)]),  # For student transaction history
+    ],
+    "paystackTransactions": [
+        IndexModel([("reference", ASCENDING)], unique=True),
+        IndexModel([("studentId", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("studentId", ASCENDING), ("createdAt", DESCENDING)]),  # For student payment history
+        IndexModel([("eventId", ASCENDING), ("studentId", ASCENDING), ("status", ASCENDING)]),
+    ],
+    "bankTransfers": [
+        IndexModel([("studentId", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("transactionReference", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("createdAt", DESCENDING)]),  # For pending transfers
+        IndexModel([("eventId", ASCENDING), ("studentId", ASCENDING), ("status", ASCENDING)]),
+    ],
+    "events": [
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("date", ASCENDING)]),
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("date", ASCENDING)]),  # For session events sorted by date
+        IndexModel([("registrations", ASCENDING)]),  # For checking if user is registered
+        IndexModel([("date", ASCENDING), ("sessionId", ASCENDING)]),  # For upcoming events queries
+        IndexModel([("title", "text"), ("description", "text")]),
+    ],
+    "announcements": [
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("targetLevels", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("priority", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("createdAt", DESCENDING)]),  # For recent announcements
+        IndexModel([("targetLevels", ASCENDING), ("createdAt", DESCENDING)]),  # For level-specific announcements
+        IndexModel([("title", "text"), ("content", "text")]),
+    ],
+    "unit_applications": [
+        IndexModel([("studentId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("status", ASCENDING)]),  # For filtering applications
+    ],
+    # Email daily usage counters (provider/day quota tracking)
+    "email_daily_usage": [
+        IndexModel([("day", ASCENDING), ("provider", ASCENDING)], unique=True),
+        IndexModel([("updatedAt", ASCENDING)]),
+    ],
+    "resources": [
+        IndexModel([("title", "text"), ("description", "text"), ("tags", "text")]),
+        IndexModel([("uploadedBy", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("courseCode", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("createdAt", DESCENDING)]),
+    ],
+    "audit_logs": [
+        IndexModel([("userId", ASCENDING)]),
+        IndexModel([("action", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)]),
+        IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING)]),
+    ],
+    "press_articles": [
+        IndexModel([("authorId", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("slug", ASCENDING)], unique=True, sparse=True),
+        IndexModel([("publishedAt", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("publishedAt", DESCENDING)]),
+    ],
+    "article_views": [
+        IndexModel([("articleId", ASCENDING), ("viewerIp", ASCENDING)], unique=True),
+    ],
+    "study_groups": [
+        IndexModel([("members", ASCENDING)]),
+        IndexModel([("createdBy", ASCENDING)]),
+        IndexModel([("isActive", ASCENDING)]),
+    ],
+    # IEPOD
+    "iepod_registrations": [
+        IndexModel([("userId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("userId", ASCENDING), ("sessionId", ASCENDING)], unique=True),
+        IndexModel([("sessionId", ASCENDING), ("userId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("status", ASCENDING), ("createdAt", DESCENDING)]),
+    ],
+    "iepod_societies": [
+        IndexModel([("sessionId", ASCENDING)]),
+    ],
+    "iepod_points": [
+        IndexModel([("sessionId", ASCENDING), ("userId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("awardedAt", DESCENDING)]),
+        IndexModel([("registrationId", ASCENDING), ("phase", ASCENDING)]),
+    ],
+    "iepod_quiz_points": [
+        IndexModel([("sessionId", ASCENDING), ("userId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("awardedAt", DESCENDING)]),
+    ],
+    "iepod_quiz_responses": [
+        IndexModel([("registrationId", ASCENDING), ("quizId", ASCENDING)]),
+    ],
+    "iepod_live_quiz_sessions": [
+        IndexModel([("sessionId", ASCENDING), ("joinCode", ASCENDING)]),
+        IndexModel([("quizId", ASCENDING), ("status", ASCENDING)]),
+    ],
+    "iepod_live_quiz_participants": [
+        IndexModel([("liveSessionId", ASCENDING), ("userId", ASCENDING)], unique=True),
+    ],
+    "iepod_live_quiz_answers": [
+        IndexModel([("liveSessionId", ASCENDING), ("questionIndex", ASCENDING)]),
+        IndexModel([("liveSessionId", ASCENDING), ("userId", ASCENDING), ("questionIndex", ASCENDING)], unique=True),
+    ],
+    # TIMP
+    "timpApplications": [
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("userId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("userId", ASCENDING)], unique=True),
+    ],
+    "timpPairs": [
+        IndexModel([("sessionId", ASCENDING)]),
+        IndexModel([("mentorId", ASCENDING)]),
+        IndexModel([("menteeId", ASCENDING)]),
+        IndexModel([("sessionId", ASCENDING), ("status", ASCENDING)]),
+    ],
+}
+
+
+
+async def _supports_transactions(client) -> bool:
+    """Transactions need a replica set or sharded cluster; standalone servers reject them."""
+    hello = await client.admin.command("hello")
+    return "setName" in hello or hello.get("msg") == "isdbgrid"
 
 
 async def init_database():
     """Initialize the database with default data and indexes."""
     
     # Connect to MongoDB
-    client = AsyncIOMotorClient(MONGODB_URL)
+    client = get_client()
     db = client[DATABASE_NAME]
     
     print("🚀 Starting IESA Database Initialization...")
@@ -44,7 +216,13 @@ async def init_database():
     
     # 2. Create Default Academic Session
     print("📅 Creating default academic session...")
-    session_id = await create_default_session(db)
+    if await _supports_transactions(client):
+        session_id = await run_in_transaction(
+            client, lambda session: create_default_session(db, session=session)
+        )
+    else:
+        # Standalone servers (e.g. the docker-compose mongo) have no transactions
+        session_id = await create_default_session(db)
     print(f"✅ Session created: {session_id}")
     print()
     
@@ -62,133 +240,12 @@ async def init_database():
     print("   2. Make them admin by running:")
     print("      python -m app.scripts.make_admin <email>")
     print()
-    
-    client.close()
 
 
 async def create_indexes(db):
     """Create database indexes for better query performance."""
     
-    # Users collection indexes
-    await db.users.create_index("email", unique=True)
-    await db.users.create_index("matricNumber")
-    await db.users.create_index("role")
-    await db.users.create_index("isActive")
-    await db.users.create_index("createdAt")
-    await db.users.create_index([("firstName", 1), ("lastName", 1)])  # For name searches
-    
-    # Sessions collection indexes
-    await db.sessions.create_index("isActive")
-    await db.sessions.create_index("name", unique=True)
-    await db.sessions.create_index([("startDate", -1)])  # For date range queries
-    
-    # Enrollments collection indexes
-    await db.enrollments.create_index([("studentId", 1), ("sessionId", 1)], unique=True)
-    await db.enrollments.create_index("sessionId")
-    await db.enrollments.create_index("level")
-    await db.enrollments.create_index("isActive")
-    await db.enrollments.create_index([("sessionId", 1), ("level", 1)])  # Compound index for session+level queries
-    
-    # Roles collection indexes
-    await db.roles.create_index([("userId", 1), ("sessionId", 1), ("position", 1)], unique=True)
-    await db.roles.create_index("sessionId")
-    await db.roles.create_index("position")
-    await db.roles.create_index("userId")
-    await db.roles.create_index("isActive")
-    await db.roles.create_index([("sessionId", 1), ("isActive", 1)])  # For active roles in session
-    
-    # Payments collection indexes
-    await db.payments.create_index("sessionId")
-    await db.payments.create_index("category")
-    await db.payments.create_index("dueDate")
-    await db.payments.create_index("isActive")
-    await db.payments.create_index([("sessionId", 1), ("isActive", 1)])  # For active payments in session
-    
-    # Transactions collection indexes
-    await db.transactions.create_index("studentId")
-    await db.transactions.create_index("paymentId")
-    await db.transactions.create_index("sessionId")
-    await db.transactions.create_index("reference", unique=True)
-    await db.transactions.create_index("status")
-    await db.transactions.create_index("createdAt")
-    await db.transactions.create_index([("studentId", 1), ("createdAt", -1)])  # For student transaction history
-    
-    # Paystack Transactions collection indexes
-    await db.paystackTransactions.create_index("reference", unique=True)
-    await db.paystackTransactions.create_index("studentId")
-    await db.paystackTransactions.create_index("status")
-    await db.paystackTransactions.create_index("createdAt")
-    await db.paystackTransactions.create_index([("studentId", 1), ("createdAt", -1)])  # For student payment history
-    
-    # Bank Transfers collection indexes
-    await db.bankTransfers.create_index("studentId")
-    await db.bankTransfers.create_index("status")
-    await db.bankTransfers.create_index("createdAt")
-    await db.bankTransfers.create_index("transactionReference")
-    await db.bankTransfers.create_index([("status", 1), ("createdAt", -1)])  # For pending transfers
-    
-    # Events collection indexes
-    await db.events.create_index("sessionId")
-    await db.events.create_index("date")
-    await db.events.create_index("category")
-    await db.events.create_index([("sessionId", 1), ("date", 1)])  # For session events sorted by date
-    await db.events.create_index("registrations")  # For checking if user is registered
-    await db.events.create_index([("date", 1), ("sessionId", 1)])  # For upcoming events queries
-    
-    # Announcements collection indexes
-    await db.announcements.create_index("sessionId")
-    await db.announcements.create_index("targetLevels")
-    await db.announcements.create_index("createdAt")
-    await db.announcements.create_index("priority")
-    await db.announcements.create_index([("sessionId", 1), ("createdAt", -1)])  # For recent announcements
-    await db.announcements.create_index([("targetLevels", 1), ("createdAt", -1)])  # For level-specific announcements
-    
-    # Unit Applications collection indexes
-    await db.unit_applications.create_index("studentId")
-    await db.unit_applications.create_index("sessionId")
-    await db.unit_applications.create_index("status")
-    await db.unit_applications.create_index([("sessionId", 1), ("status", 1)])  # For filtering applications
-
-    # Email daily usage counters (provider/day quota tracking)
-    await db.email_daily_usage.create_index([("day", 1), ("provider", 1)], unique=True)
-    await db.email_daily_usage.create_index("updatedAt")
-    
-    # Paystack + Bank Transfers compound indexes for event payment lookups
-    await db.paystackTransactions.create_index([("eventId", 1), ("studentId", 1), ("status", 1)])
-    await db.bankTransfers.create_index([("eventId", 1), ("studentId", 1), ("status", 1)])
-    
-    # Text indexes for search endpoints
-    await db.announcements.create_index([("title", "text"), ("content", "text")])
-    await db.events.create_index([("title", "text"), ("description", "text")])
-    await db.resources.create_index([("title", "text"), ("description", "text"), ("tags", "text")])
-    
-    # Audit Logs collection indexes
-    await db.audit_logs.create_index("userId")
-    await db.audit_logs.create_index("action")
-    await db.audit_logs.create_index("createdAt")
-    await db.audit_logs.create_index([("userId", 1), ("createdAt", -1)])
-    
-    # Press / Articles collection indexes
-    await db.press_articles.create_index("authorId")
-    await db.press_articles.create_index("status")
-    await db.press_articles.create_index("slug", unique=True, sparse=True)
-    await db.press_articles.create_index("publishedAt")
-    await db.press_articles.create_index([("status", 1), ("publishedAt", -1)])
-    await db.article_views.create_index([("articleId", 1), ("viewerIp", 1)], unique=True)
-    
-    # Study Groups collection indexes
-    await db.study_groups.create_index("members")
-    await db.study_groups.create_index("createdBy")
-    await db.study_groups.create_index("isActive")
-    
-    # Resources collection indexes
-    await db.resources.create_index("uploadedBy")
-    await db.resources.create_index("status")
-    await db.resources.create_index("courseCode")
-    await db.resources.create_index([("status", 1), ("createdAt", -1)])
-    
-    # IEPOD collection indexes
-    # Drop legacy indexes that used wrong field name (studentId instead of userId)
+    # IEPOD: drop legacy indexes that used wrong field name (studentId instead of userId)
     try:
         await db.iepod_registrations.drop_index("studentId_1")
     except Exception:
@@ -197,41 +254,21 @@ async def create_indexes(db):
         await db.iepod_registrations.drop_index("studentId_1_sessionId_1")
     except Exception:
         pass
-    await db.iepod_registrations.create_index("userId")
-    await db.iepod_registrations.create_index("sessionId")
-    await db.iepod_registrations.create_index([("userId", 1), ("sessionId", 1)], unique=True)
-    await db.iepod_registrations.create_index([("sessionId", 1), ("userId", 1)])
-    await db.iepod_registrations.create_index([("sessionId", 1), ("status", 1), ("createdAt", -1)])
-    await db.iepod_societies.create_index("sessionId")
-    await db.iepod_points.create_index([("sessionId", 1), ("userId", 1)])
-    await db.iepod_points.create_index([("sessionId", 1), ("awardedAt", -1)])
-    await db.iepod_points.create_index([("registrationId", 1), ("phase", 1)])
-    await db.iepod_quiz_points.create_index([("sessionId", 1), ("userId", 1)])
-    await db.iepod_quiz_points.create_index([("sessionId", 1), ("awardedAt", -1)])
-    await db.iepod_quiz_responses.create_index([("registrationId", 1), ("quizId", 1)])
-    await db.iepod_live_quiz_sessions.create_index([("sessionId", 1), ("joinCode", 1)])
-    await db.iepod_live_quiz_sessions.create_index([("quizId", 1), ("status", 1)])
-    await db.iepod_live_quiz_participants.create_index([("liveSessionId", 1), ("userId", 1)], unique=True)
-    await db.iepod_live_quiz_answers.create_index([("liveSessionId", 1), ("questionIndex", 1)])
-    await db.iepod_live_quiz_answers.create_index([("liveSessionId", 1), ("userId", 1), ("questionIndex", 1)], unique=True)
     
-    # TIMP collection indexes
-    await db.timpApplications.create_index("sessionId")
-    await db.timpApplications.create_index("userId")
-    await db.timpApplications.create_index([("sessionId", 1), ("userId", 1)], unique=True)
-    await db.timpPairs.create_index("sessionId")
-    await db.timpPairs.create_index("mentorId")
-    await db.timpPairs.create_index("menteeId")
-    await db.timpPairs.create_index([("sessionId", 1), ("status", 1)])
+    for collection_name, indexes in COLLECTION_INDEXES.items():
+        await db[collection_name].create_indexes(indexes)
 
 
-async def create_default_session(db):
-    """Create the first active academic session based on UI academic calendar."""
+async def create_default_session(db, session=None):
+    """
+    Create the first active academic session based on UI academic calendar.
+    Pass a client session to run the check + insert inside a transaction.
+    """
     
     sessions = db.sessions
     
     # Check if any session exists
-    existing = await sessions.find_one({})
+    existing = await sessions.find_one({}, session=session)
     if existing:
         print("   ⚠️  Session already exists, skipping...")
         return str(existing["_id"])
@@ -275,7 +312,7 @@ async def create_default_session(db):
     print(f"   📚 Current semester: {current_semester}")
     print(f"   📆 Session period: Feb {session_start_year} - Feb {session_end_year}")
     
-    result = await sessions.insert_one(session_data)
+    result = await sessions.insert_one(session_data, session=session)
     return str(result.inserted_id)
 
 
@@ -289,6 +326,7 @@ async def create_admin_user(db):
     This is here only for initial development/testing.
     """
     users = db.users
+    now = datetime.now(timezone.utc)
     
     admin_data = {
         "email": "admin@iesa.edu",
@@ -303,9 +341,9 @@ async def create_admin_user(db):
         "currentLevel": None,
         "skills": [],
         "isActive": True,
-        "createdAt": datetime.now(timezone.utc),
-        "updatedAt": datetime.now(timezone.utc),
-        "lastLogin": datetime.now(timezone.utc)
+        "createdAt": now,
+        "updatedAt": now,
+        "lastLogin": now
     }
     
     result = await users.insert_one(admin_data)
@@ -6,19 +6,15 @@ Usage:
 """
 
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
-import os
-from dotenv import load_dotenv
+import sys
+from app.utils.mongo import get_client, DATABASE_NAME
 
-load_dotenv()
-
-MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-DATABASE_NAME = os.getenv("DATABASE_NAME", "iesa_db")
+DUMMY_ADMIN_EMAIL_PATTERN = r"@iesa\.ui\.edu\.ng$"
 
 
 async def list_emails():
     """List all generated student emails"""
-    client = AsyncIOMotorClient(MONGODB_URL)
+    client = get_client()
     db = client[DATABASE_NAME]
     
     print("\n" + "=" * 70)
@@ -26,32 +22,56 @@ async def list_emails():
     print("=" * 70)
     print()
     
-    # Get admin
-    admin = await db.users.find_one({"role": "admin", "email": {"$regex": "@iesa.ui.edu.ng"}})
+    # Admin + every level in one aggregation: the leading $match narrows to
+    # indexed role/level docs, then $facet buckets them server-side.
+    # No per-level cap: every student is listed. The only bound is $facet's
+    # 16MB result document (~100k projected students), far above dummy data.
+    levels = [100, 200, 300, 400, 500]
+    level_names = [f"{level}L" for level in levels]
+    projection = {"email": 1, "firstName": 1, "lastName": 1, "matricNumber": 1}
+    facets = {
+        "admin": [
+            {"$match": {"role": "admin", "email": {"$regex": DUMMY_ADMIN_EMAIL_PATTERN}}},
+            {"$limit": 1},
+            {"$project": projection},
+        ],
+    }
+    for level_name in level_names:
+        facets[level_name] = [
+            {"$match": {"role": "student", "currentLevel": level_name}},
+            {"$sort": {"email": 1}},
+            {"$project": projection},
+        ]
+    pipeline = [
+        {"$match": {"$or": [
+            {"role": "admin"},
+            {"role": "student", "currentLevel": {"$in": level_names}},
+        ]}},
+        {"$facet": facets},
+    ]
+    buckets = (await db.users.aggregate(pipeline).to_list(1))[0]
+    total_students = 0
+    
+    admin = buckets["admin"][0] if buckets["admin"] else None
     if admin:
         print("👤 ADMIN:")
         print(f"   Email: {admin['email']}")
         print(f"   Name: {admin.get('firstName', '')} {admin.get('lastName', '')}")
         print()
     
-    # Get students by level
-    levels = [100, 200, 300, 400, 500]
-    total_students = 0
-    
-    for level in levels:
-        students = await db.users.find(
-            {"role": "student", "currentLevel": f"{level}L"}
-        ).sort("email", 1).to_list(length=100)
-        
+    for level_name in level_names:
+        students = buckets[level_name]
         if students:
-            print(f"👥 {level}L STUDENTS ({len(students)}):")
+            # One write per level instead of one print per student
+            lines = [f"👥 {level_name} STUDENTS ({len(students)}):"]
             for student in students:
                 email = student.get('email', 'N/A')
                 name = f"{student.get('firstName', '')} {student.get('lastName', '')}"
                 matric = student.get('matricNumber', 'N/A')
-                print(f"   • {email:<45} | {name:<25} | {matric}")
-                total_students += 1
-            print()
+                lines.append(f"   • {email:<45} | {name:<25} | {matric}")
+            total_students += len(students)
+            sys.stdout.write("\n".join(lines) + "\n\n")
+            sys.stdout.flush()
     
     print("=" * 70)
     print(f"📊 Total: {total_students} students + 1 admin = {total_students + 1} accounts")
@@ -60,8 +80,6 @@ async def list_emails():
     print("⚠️  REMEMBER: Register these emails at http://localhost:3000/register")
     print("   with any password (e.g., Test@123) before logging in.")
     print()
-    
-    client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""
+Make Admin Script
+
+Promotes a registered user to the admin role.
+The user must have signed up via the frontend first.
+
+Usage:
+    python -m app.scripts.make_admin <email>
+    python -m app.scripts.make_admin --bulk <email> [<email> ...]
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pymongo import ReturnDocument, WriteConcern
+from app.utils.mongo import get_client, DATABASE_NAME
+
+
+async def make_admin(email: str):
+    """Promote the user with the given email to admin."""
+
+    client = get_client()
+    db = client[DATABASE_NAME]
+    # One-off admin toggle: primary ack is enough, no need to wait for majority
+    users = db.get_collection("users", write_concern=WriteConcern(w=1))
+
+    print(f"👤 Promoting {email} to admin...")
+    print(f"📊 Database: {DATABASE_NAME}")
+    print()
+
+    projection = {"firstName": 1, "lastName": 1, "email": 1, "role": 1}
+
+    # Fetch + promote in one round-trip. The role filter keeps re-runs on an
+    # existing admin from writing at all; the pre-image tells us what changed.
+    previous = await users.find_one_and_update(
+        {"email": email, "role": {"$ne": "admin"}},
+        {"$set": {"role": "admin", "updatedAt": datetime.now(timezone.utc)}},
+        projection=projection,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+    if previous is None:
+        # Either missing or already admin — a cheap read tells which
+        existing = await users.find_one({"email": email}, projection)
+        if existing is None:
+            print(f"❌ No user found with email: {email}")
+            print("   Register via the frontend first, then re-run this script.")
+        else:
+            name = f"{existing.get('firstName', '')} {existing.get('lastName', '')}".strip()
+            print(f"⚠️  {name} is already an admin. No changes needed.")
+        return
+
+    name = f"{previous.get('firstName', '')} {previous.get('lastName', '')}".strip()
+    print(f"✅ {name} promoted: {previous.get('role', 'student')} → admin")
+
+
+async def make_admins(emails: list[str]):
+    """Promote several users to admin with a single update_many."""
+
+    client = get_client()
+    db = client[DATABASE_NAME]
+    # One-off admin toggle: primary ack is enough, no need to wait for majority
+    users = db.get_collection("users", write_concern=WriteConcern(w=1))
+
+    print(f"👥 Promoting {len(emails)} users to admin...")
+    print(f"📊 Database: {DATABASE_NAME}")
+    print()
+
+    result = await users.update_many(
+        {"email": {"$in": emails}, "role": {"$ne": "admin"}},
+        {"$set": {"role": "admin", "updatedAt": datetime.now(timezone.utc)}},
+    )
+
+    print(f"✅ Promoted: {result.modified_count}")
+    print(f"⚠️  Already admin or not found: {len(emails) - result.modified_count}")
+
+
+if __name__ == "__main__":
+    bulk = len(sys.argv) > 1 and sys.argv[1] == "--bulk"
+    if (bulk and len(sys.argv) < 3) or (not bulk and len(sys.argv) != 2):
+        print("❌ Usage: python -m app.scripts.make_admin <email>")
+        print("          python -m app.scripts.make_admin --bulk <email> [<email> ...]")
+        sys.exit(1)
+
+    print()
+    print("=" * 60)
+    print("   IESA Make Admin Tool")
+    print("=" * 60)
+    print()
+
+    if bulk:
+        asyncio.run(make_admins([email.strip() for email in sys.argv[2:]]))
+    else:
+        asyncio.run(make_admin(sys.argv[1].strip()))
+
+    print()
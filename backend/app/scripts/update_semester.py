@@ -11,16 +11,9 @@ Usage:
 
 import asyncio
 import argparse
-from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-DATABASE_NAME = os.getenv("DATABASE_NAME", "iesa_db")
+from pymongo import WriteConcern
+from app.utils.mongo import get_client, DATABASE_NAME
 
 
 async def update_semester(semester_number: int):
@@ -30,14 +23,15 @@ async def update_semester(semester_number: int):
         print("❌ Invalid semester number. Must be 1 or 2.")
         return
     
-    client = AsyncIOMotorClient(MONGODB_URL)
+    client = get_client()
     db = client[DATABASE_NAME]
     
     print(f"📚 Updating to Semester {semester_number}...")
     print(f"📊 Database: {DATABASE_NAME}")
     print()
     
-    sessions = db.sessions
+    # One-off admin toggle: primary ack is enough, no need to wait for majority
+    sessions = db.get_collection("sessions", write_concern=WriteConcern(w=1))
     
     # Find the active session
     active_session = await sessions.find_one({"isActive": True})
@@ -45,7 +39,6 @@ async def update_semester(semester_number: int):
     if not active_session:
         print("❌ No active session found!")
         print("   Run: python -m app.scripts.init_db")
-        client.close()
         return
     
     current_semester = active_session.get("currentSemester", 1)
@@ -57,7 +50,6 @@ async def update_semester(semester_number: int):
     
     if current_semester == semester_number:
         print(f"⚠️  Already in semester {semester_number}. No changes needed.")
-        client.close()
         return
     
     # Update semester
@@ -95,8 +87,6 @@ async def update_semester(semester_number: int):
         print("   • Send semester transition announcement to students")
     else:
         print("⚠️  Update failed or no changes made")
-    
-    client.close()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,14 @@ blocking the FastAPI event loop.
 """
 
 import asyncio
+import hashlib
+import logging
 import os
 import cloudinary
 import cloudinary.uploader
-from typing import Optional
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger("iesa_backend")
 
 # Configure Cloudinary
 cloudinary.config(
@@ -26,22 +30,46 @@ def _sync_upload(file_data: bytes, **kwargs) -> dict:
     return cloudinary.uploader.upload(file_data, **kwargs)
 
 
+def _sync_upload_large(file_obj: BinaryIO, **kwargs) -> dict:
+    """Thin sync wrapper for chunked uploads — called inside an executor."""
+    return cloudinary.uploader.upload_large(file_obj, **kwargs)
+
+
+def _file_digest(file_obj: BinaryIO) -> str:
+    """Short SHA-256 of a file object's contents; rewinds it afterwards."""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(1024 * 1024), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()[:16]
+
+
 def _sync_destroy(public_id: str) -> dict:
     """Thin sync wrapper — called inside an executor."""
     return cloudinary.uploader.destroy(public_id)
 
 
-async def upload_profile_picture(file_data: bytes, user_id: str, file_extension: str = "jpg") -> Optional[str]:
+async def upload_profile_picture(file_obj: BinaryIO, user_id: str, file_extension: str = "jpg") -> Optional[dict]:
     """
     Upload a profile picture to Cloudinary (async, non-blocking).
+    The file object is handed to upload_large without a bytes copy. Profile
+    pictures are capped at 2MB, under Cloudinary's 5MB minimum chunk, so the
+    upload is a single chunk read into memory once.
+
+    The public_id carries a hash of the image, so re-saving the same avatar
+    reuses the existing asset (and its CDN cache) instead of re-uploading.
+    Returns dict with {url, publicId} or None on failure.
     """
     try:
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _sync_upload(
-            file_data,
+        digest = await loop.run_in_executor(None, _file_digest, file_obj)
+        result = await loop.run_in_executor(None, lambda: _sync_upload_large(
+            file_obj,
+            chunk_size=6_000_000,
             folder="iesa/profile_pictures",
-            public_id=f"user_{user_id}",
-            overwrite=True,
+            public_id=f"user_{user_id}_{digest}",
+            overwrite=False,
+            unique_filename=False,
             resource_type="image",
             transformation=[
                 {"width": 400, "height": 400, "crop": "fill", "gravity": "face"},
@@ -49,23 +77,25 @@ async def upload_profile_picture(file_data: bytes, user_id: str, file_extension:
                 {"fetch_format": "auto"}
             ]
         ))
-        return result.get("secure_url")
-    except Exception as e:
-        print(f"Error uploading to Cloudinary: {str(e)}")
+        return {
+            "url": result.get("secure_url"),
+            "publicId": result.get("public_id"),
+        }
+    except Exception:
+        logger.exception("Cloudinary profile picture upload failed for user %s", user_id)
         return None
 
 
-async def delete_profile_picture(user_id: str) -> bool:
+async def delete_profile_picture(public_id: str) -> bool:
     """
     Delete a profile picture from Cloudinary (async, non-blocking).
     """
     try:
         loop = asyncio.get_running_loop()
-        public_id = f"iesa/profile_pictures/user_{user_id}"
         result = await loop.run_in_executor(None, lambda: _sync_destroy(public_id))
         return result.get("result") == "ok"
-    except Exception as e:
-        print(f"Error deleting from Cloudinary: {str(e)}")
+    except Exception:
+        logger.exception("Cloudinary delete failed for %s", public_id)
         return False
 
 
@@ -88,8 +118,8 @@ async def upload_transfer_receipt(file_data: bytes, transfer_id: str, file_exten
             ]
         ))
         return result.get("secure_url")
-    except Exception as e:
-        print(f"Error uploading transfer receipt to Cloudinary: {str(e)}")
+    except Exception:
+        logger.exception("Cloudinary transfer receipt upload failed for %s", transfer_id)
         return None
 
 
@@ -131,8 +161,8 @@ async def upload_dm_attachment(file_data: bytes, sender_id: str, file_extension:
             "publicId": result.get("public_id"),
             "resourceType": resource_type,
         }
-    except Exception as e:
-        print(f"Error uploading DM attachment to Cloudinary: {str(e)}")
+    except Exception:
+        logger.exception("Cloudinary DM attachment upload failed for sender %s", sender_id)
         return None
 
 
@@ -155,6 +185,6 @@ async def upload_press_cover(file_data: bytes, article_id: str, file_extension:
             ]
         ))
         return result.get("secure_url")
-    except Exception as e:
-        print(f"Error uploading press cover to Cloudinary: {str(e)}")
+    except Exception:
+        logger.exception("Cloudinary press cover upload failed for article %s", article_id)
         return None
@@ -0,0 +1,29 @@
+"""
+Shared MongoDB Client for Admin Scripts
+
+Maintenance scripts (init_db, update_semester, list_dummy_emails, ...) run
+outside the FastAPI lifespan, so they can't use app.db's client. This module
+caches one AsyncIOMotorClient per process so TLS + topology discovery is paid
+once, no matter how many scripts or helpers ask for a connection.
+"""
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+load_dotenv()
+
+MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+DATABASE_NAME = os.getenv("DATABASE_NAME", "iesa_db")
+
+_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_client() -> AsyncIOMotorClient:
+    """Return the process-wide Motor client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(MONGODB_URL, maxPoolSize=50, minPoolSize=5)
+    return _client
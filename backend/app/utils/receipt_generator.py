@@ -15,9 +15,19 @@ to avoid consuming ~30-50MB on startup when receipts aren't being generated.
 
 from io import BytesIO
 from datetime import datetime
+import asyncio
+from functools import lru_cache
 from typing import Optional
+import logging
 import os
 
+logger = logging.getLogger("iesa_backend")
+
+# Opt-in: render a throwaway receipt at startup so the first real request
+# doesn't pay the reportlab/qrcode import cost. Off by default because the
+# lazy imports exist to keep idle memory down.
+RECEIPT_PREWARM = os.getenv("RECEIPT_PREWARM", "0").strip().lower() in {"1", "true", "yes", "on"}
+
 
 # Resolve logo path relative to this file
 _LOGO_PATH = os.path.join(
@@ -26,6 +36,58 @@ _LOGO_PATH = os.path.join(
 )
 
 
+@lru_cache(maxsize=None)
+def _hex_color(value: str):
+    """Parse a hex colour once; ReportLab Color objects are immutable and shareable."""
+    from reportlab.lib import colors
+    return colors.HexColor(value)
+
+
+@lru_cache(maxsize=1)
+def _logo_reader():
+    """
+    Decode the IESA logo once per process. The header chrome is identical on
+    every receipt, so there's no reason to re-open and re-parse the PNG each time.
+    """
+    from reportlab.lib.utils import ImageReader
+    if not os.path.exists(_LOGO_PATH):
+        return None
+    return ImageReader(_LOGO_PATH)
+
+
+@lru_cache(maxsize=1024)
+def _qr_png_bytes(data: str, fill_color: str) -> bytes:
+    """
+    Encode a QR code to PNG bytes. Cached by payload (~2KB per entry), so
+    re-downloading or re-emailing the same receipt skips the QR encode.
+    """
+    import qrcode as qr_module
+    qr = qr_module.QRCode(
+        version=1,
+        error_correction=qr_module.constants.ERROR_CORRECT_L,
+        box_size=8,
+        border=1,
+        # Fixed mask: skips the 8-way best_mask_pattern penalty search, which
+        # is most of qrcode's encode time. Any mask is valid for scanners.
+        mask_pattern=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = BytesIO()
+    qr.make_image(fill_color=fill_color, back_color="white").save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _qr_image_reader(data: str, fill_color: str):
+    """
+    ReportLab ImageReader over the cached PNG. Built per call on purpose: a
+    cached reader keeps the decoded image (hundreds of KB) alive per payload.
+    """
+    from reportlab.lib.utils import ImageReader
+    return ImageReader(BytesIO(_qr_png_bytes(data, fill_color)))
+
+
 class ReceiptGenerator:
     """Generate PDF receipts for payments"""
 
@@ -40,27 +102,62 @@ class ReceiptGenerator:
 
     def __init__(self):
         from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch, mm
         self.pagesize = A4
         self.width, self.height = self.pagesize
 
-    def generate_qr_code(self, data: str) -> BytesIO:
-        """Generate QR code as BytesIO"""
-        import qrcode as qr_module
-        qr = qr_module.QRCode(
-            version=1,
-            error_correction=qr_module.constants.ERROR_CORRECT_L,
-            box_size=8,
-            border=1,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
+        # Fixed page geometry — depends only on the page size, so work it out
+        # once here rather than on every receipt
+        W, H = self.width, self.height
+        self.left = 1 * inch
+        self.right = W - 1 * inch
+        self.content_w = self.right - self.left
+        self.header_h = 1.4 * inch
+        self.accent_h = 4 * mm
+        self.logo_y = H - self.header_h + 0.25 * inch
+        self.logo_size = 0.9 * inch
+        self.card_top = H - self.header_h - self.accent_h - 0.3 * inch
+        self.card_bottom = 1.8 * inch
+        self.card_h = self.card_top - self.card_bottom
+        self.card_x = self.left - 0.1 * inch
+        self.card_w = self.content_w + 0.2 * inch
+        self.section_x = self.left + 0.1 * inch
+        self.row_step = 0.24 * inch
+        self.value_x = self.section_x + 1.3 * inch
+        self.qr_size = 1.0 * inch
+        self.qr_x = self.right - self.qr_size
+        self.qr_y = 0.5 * inch
+
+        # (date, formatted) for the footer's "Generated <date>" stamp
+        self._today_cache = (None, "")
+
+    def _today_label(self) -> str:
+        """Today's date as shown in the footer, re-formatted only when the day changes."""
+        today = datetime.now().date()
+        cached_date, label = self._today_cache
+        if today != cached_date:
+            label = today.strftime('%B %d, %Y')
+            self._today_cache = (today, label)
+        return label
+
+    def _draw_detail_rows(self, pdf, y: float, rows: list) -> float:
+        """
+        Draw label/value rows starting at y and return the y below the last row.
+        Two passes (labels, then values) so each font/colour is set once.
+        """
+        row_ys = [y - i * self.row_step for i in range(len(rows))]
 
-        img = qr.make_image(fill_color=self.NAVY, back_color="white")
+        pdf.setFont("Helvetica", 9)
+        pdf.setFillColor(_hex_color("#888888"))
+        for row_y, (label, _) in zip(row_ys, rows):
+            pdf.drawString(self.section_x, row_y, label)
 
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-        return buffer
+        pdf.setFont("Helvetica-Bold", 10)
+        pdf.setFillColor(_hex_color(self.NAVY))
+        for row_y, (_, value) in zip(row_ys, rows):
+            pdf.drawString(self.value_x, row_y, value)
+
+        return y - len(rows) * self.row_step
 
     def generate_receipt(
         self,
@@ -80,7 +177,6 @@ class ReceiptGenerator:
         from reportlab.lib.units import inch, mm
         from reportlab.lib import colors
         from reportlab.pdfgen import canvas
-        from reportlab.lib.utils import ImageReader
 
         buffer = BytesIO()
         pdf = canvas.Canvas(buffer, pagesize=self.pagesize)
@@ -88,38 +184,38 @@ class ReceiptGenerator:
 
         W = self.width
         H = self.height
-        left = 1 * inch
-        right = W - 1 * inch
-        content_w = right - left
+        left = self.left
+        right = self.right
+        content_w = self.content_w
 
         # ═══════════════════════════════════════════════════════
         # BACKGROUND — subtle off-white
         # ═══════════════════════════════════════════════════════
-        pdf.setFillColor(colors.HexColor(self.GHOST))
+        pdf.setFillColor(_hex_color(self.GHOST))
         pdf.rect(0, 0, W, H, fill=True, stroke=False)
 
         # ═══════════════════════════════════════════════════════
         # HEADER BAR — navy strip at top
         # ═══════════════════════════════════════════════════════
-        header_h = 1.4 * inch
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        header_h = self.header_h
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.rect(0, H - header_h, W, header_h, fill=True, stroke=False)
 
         # Lime accent bar under header
-        accent_h = 4 * mm
-        pdf.setFillColor(colors.HexColor(self.LIME))
+        accent_h = self.accent_h
+        pdf.setFillColor(_hex_color(self.LIME))
         pdf.rect(0, H - header_h - accent_h, W, accent_h, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.TEAL))
+        pdf.setFillColor(_hex_color(self.TEAL))
         pdf.rect(0, H - header_h - accent_h - 2 * mm, W * 0.36, 2 * mm, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.CORAL))
+        pdf.setFillColor(_hex_color(self.CORAL))
         pdf.rect(W * 0.64, H - header_h - accent_h - 2 * mm, W * 0.36, 2 * mm, fill=True, stroke=False)
 
         # Logo (if available)
-        logo_y = H - header_h + 0.25 * inch
+        logo_y = self.logo_y
         try:
-            if os.path.exists(_LOGO_PATH):
-                logo = ImageReader(_LOGO_PATH)
-                logo_size = 0.9 * inch
+            logo = _logo_reader()
+            if logo is not None:
+                logo_size = self.logo_size
                 pdf.drawImage(logo, left, logo_y, width=logo_size, height=logo_size,
                               preserveAspectRatio=True, mask='auto')
                 text_x = left + 1.05 * inch
@@ -134,12 +230,12 @@ class ReceiptGenerator:
         pdf.drawString(text_x, logo_y + 0.55 * inch, "IESA")
 
         pdf.setFont("Helvetica", 9)
-        pdf.setFillColor(colors.HexColor("#CCCCCC"))
+        pdf.setFillColor(_hex_color("#CCCCCC"))
         pdf.drawString(text_x, logo_y + 0.32 * inch, "Industrial Engineering Students' Association")
         pdf.drawString(text_x, logo_y + 0.12 * inch, "University of Ibadan, Ibadan")
 
         # Receipt title — right side of header
-        pdf.setFillColor(colors.HexColor(self.LIME))
+        pdf.setFillColor(_hex_color(self.LIME))
         pdf.setFont("Helvetica-Bold", 16)
         pdf.drawRightString(right, logo_y + 0.55 * inch, "PAYMENT RECEIPT")
 
@@ -151,35 +247,35 @@ class ReceiptGenerator:
         # ═══════════════════════════════════════════════════════
         # MAIN CONTENT CARD — white rounded rect
         # ═══════════════════════════════════════════════════════
-        card_top = H - header_h - accent_h - 0.3 * inch
-        card_bottom = 1.8 * inch
-        card_h = card_top - card_bottom
-        card_x = left - 0.1 * inch
-        card_w = content_w + 0.2 * inch
+        card_top = self.card_top
+        card_bottom = self.card_bottom
+        card_h = self.card_h
+        card_x = self.card_x
+        card_w = self.card_w
 
         # Card shadow
-        pdf.setFillColor(colors.HexColor("#000000"))
+        pdf.setFillColor(_hex_color("#000000"))
         pdf.roundRect(card_x + 5, card_bottom - 5, card_w, card_h, 14, fill=True, stroke=False)
 
         # Card body
         pdf.setFillColor(colors.white)
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(2)
         pdf.roundRect(card_x, card_bottom, card_w, card_h, 14, fill=True, stroke=True)
 
         # ── Student Information Section ──
         y = card_top - 0.35 * inch
-        section_x = left + 0.1 * inch
+        section_x = self.section_x
 
         # Section header accent
-        pdf.setFillColor(colors.HexColor(self.LAVENDER))
+        pdf.setFillColor(_hex_color(self.LAVENDER))
         pdf.rect(section_x, y - 2, 3, 14, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.setFont("Helvetica-Bold", 11)
         pdf.drawString(section_x + 10, y, "STUDENT INFORMATION")
 
         y -= 0.1 * inch
-        pdf.setStrokeColor(colors.HexColor("#E8E8E8"))
+        pdf.setStrokeColor(_hex_color("#E8E8E8"))
         pdf.setLineWidth(0.5)
         pdf.line(section_x, y, right - 0.1 * inch, y)
 
@@ -191,25 +287,18 @@ class ReceiptGenerator:
         ]
         if student_matric:
             details.append(("Matric No", student_matric))
-        for label, value in details:
-            pdf.setFont("Helvetica", 9)
-            pdf.setFillColor(colors.HexColor("#888888"))
-            pdf.drawString(section_x, y, label)
-            pdf.setFont("Helvetica-Bold", 10)
-            pdf.setFillColor(colors.HexColor(self.NAVY))
-            pdf.drawString(section_x + 1.3 * inch, y, str(value))
-            y -= 0.24 * inch
+        y = self._draw_detail_rows(pdf, y, [(label, str(value)) for label, value in details])
 
         # ── Payment Details Section ──
         y -= 0.15 * inch
-        pdf.setFillColor(colors.HexColor(self.CORAL))
+        pdf.setFillColor(_hex_color(self.CORAL))
         pdf.rect(section_x, y - 2, 3, 14, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.setFont("Helvetica-Bold", 11)
         pdf.drawString(section_x + 10, y, "PAYMENT DETAILS")
 
         y -= 0.1 * inch
-        pdf.setStrokeColor(colors.HexColor("#E8E8E8"))
+        pdf.setStrokeColor(_hex_color("#E8E8E8"))
         pdf.line(section_x, y, right - 0.1 * inch, y)
 
         y -= 0.28 * inch
@@ -221,18 +310,14 @@ class ReceiptGenerator:
             ("Transaction ID", transaction_id),
             ("Date & Time", paid_at.strftime("%B %d, %Y at %I:%M %p")),
         ]
+        rows = []
         for label, value in payment_details:
-            pdf.setFont("Helvetica", 9)
-            pdf.setFillColor(colors.HexColor("#888888"))
-            pdf.drawString(section_x, y, label)
-            pdf.setFont("Helvetica-Bold", 10)
-            pdf.setFillColor(colors.HexColor(self.NAVY))
             # Truncate long values
             display_val = str(value)
             if len(display_val) > 50:
                 display_val = display_val[:47] + "..."
-            pdf.drawString(section_x + 1.3 * inch, y, display_val)
-            y -= 0.24 * inch
+            rows.append((label, display_val))
+        y = self._draw_detail_rows(pdf, y, rows)
 
         # ── Amount Box ──
         y -= 0.2 * inch
@@ -240,19 +325,19 @@ class ReceiptGenerator:
         amount_box_y = y - amount_box_h + 0.1 * inch
 
         # Amount highlight box
-        pdf.setFillColor(colors.HexColor(self.LIME))
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.LIME))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(2)
         pdf.roundRect(section_x, amount_box_y, content_w - 0.2 * inch, amount_box_h, 8, fill=True, stroke=True)
 
         # Label
         pdf.setFont("Helvetica-Bold", 11)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.drawString(section_x + 12, amount_box_y + amount_box_h - 0.28 * inch, "TOTAL AMOUNT PAID")
 
         # Amount
         pdf.setFont("Helvetica-Bold", 26)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         amount_text = f"NGN {amount:,.2f}"
         pdf.drawRightString(right - 0.2 * inch, amount_box_y + amount_box_h - 0.48 * inch, amount_text)
 
@@ -260,9 +345,9 @@ class ReceiptGenerator:
         y = amount_box_y - 0.35 * inch
         badge_w = 1.6 * inch
         badge_h = 0.3 * inch
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.roundRect(section_x, y, badge_w, badge_h, 6, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.LIME))
+        pdf.setFillColor(_hex_color(self.LIME))
         pdf.setFont("Helvetica-Bold", 10)
         pdf.drawCentredString(section_x + badge_w / 2, y + 0.08 * inch, "PAID SUCCESSFULLY")
 
@@ -270,15 +355,14 @@ class ReceiptGenerator:
         # QR CODE — bottom right
         # ═══════════════════════════════════════════════════════
         qr_data = f"IESA-RECEIPT|{reference}|{amount}|{paid_at.isoformat()}"
-        qr_buffer = self.generate_qr_code(qr_data)
-        qr_image = ImageReader(qr_buffer)
+        qr_image = _qr_image_reader(qr_data, self.NAVY)
 
-        qr_size = 1.0 * inch
-        qr_x = right - qr_size
-        qr_y = 0.5 * inch
+        qr_size = self.qr_size
+        qr_x = self.qr_x
+        qr_y = self.qr_y
 
         pdf.setFillColor(colors.white)
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(1.2)
         pdf.roundRect(qr_x - 0.1 * inch, qr_y - 0.12 * inch, qr_size + 0.2 * inch, qr_size + 0.22 * inch, 6, fill=True, stroke=True)
 
@@ -286,7 +370,7 @@ class ReceiptGenerator:
                        preserveAspectRatio=True, mask='auto')
 
         pdf.setFont("Helvetica", 7)
-        pdf.setFillColor(colors.HexColor("#999999"))
+        pdf.setFillColor(_hex_color("#999999"))
         pdf.drawCentredString(qr_x + qr_size / 2, qr_y - 0.12 * inch, "Scan to verify")
 
         # ═══════════════════════════════════════════════════════
@@ -294,19 +378,19 @@ class ReceiptGenerator:
         # ═══════════════════════════════════════════════════════
         footer_y = 1.1 * inch
         pdf.setFont("Helvetica-Oblique", 8)
-        pdf.setFillColor(colors.HexColor("#999999"))
+        pdf.setFillColor(_hex_color("#999999"))
         pdf.drawString(left, footer_y,
                       "This is an electronically generated receipt and does not require a signature.")
 
         pdf.setFont("Helvetica", 7)
         pdf.drawString(left, footer_y - 0.18 * inch,
-                      f"IESA · University of Ibadan · iesa@ui.edu.ng · Generated {datetime.now().strftime('%B %d, %Y')}")
+                      f"IESA · University of Ibadan · iesa@ui.edu.ng · Generated {self._today_label()}")
 
         # Bottom accent line
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(2)
         pdf.line(0, 0.3 * inch, W, 0.3 * inch)
-        pdf.setStrokeColor(colors.HexColor(self.LIME))
+        pdf.setStrokeColor(_hex_color(self.LIME))
         pdf.setLineWidth(1)
         pdf.line(0, 0.25 * inch, W, 0.25 * inch)
 
@@ -357,3 +441,34 @@ def generate_payment_receipt(
         payment_type=payment_type,
         student_matric=student_matric
     )
+
+
+async def generate_payment_receipt_async(**kwargs) -> BytesIO:
+    """
+    Async wrapper around generate_payment_receipt.
+
+    Rendering is CPU-bound (reportlab drawing, plus the QR encode on a QR
+    cache miss), so it runs in a worker thread instead of blocking the event
+    loop for every other request.
+    """
+    return await asyncio.to_thread(generate_payment_receipt, **kwargs)
+
+
+def warmup_receipt_generator() -> None:
+    """
+    Import reportlab/qrcode and build the singleton by rendering one dummy
+    receipt. Blocking — run it in a worker thread.
+    """
+    try:
+        generate_payment_receipt(
+            transaction_id="warmup",
+            reference="WARMUP",
+            student_name="Warmup",
+            student_email="warmup@iesa.local",
+            student_level="100L",
+            payment_title="Warmup",
+            amount=0.0,
+            paid_at=datetime.now(),
+        )
+    except Exception:
+        logger.exception("Receipt generator warm-up failed")
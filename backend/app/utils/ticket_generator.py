@@ -15,6 +15,7 @@ to avoid consuming memory on startup when tickets aren't being generated.
 
 from io import BytesIO
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import os
 
@@ -26,6 +27,48 @@ _LOGO_PATH = os.path.join(
 )
 
 
+@lru_cache(maxsize=None)
+def _hex_color(value: str):
+    """Parse a hex colour once; ReportLab Color objects are immutable and shareable."""
+    from reportlab.lib import colors
+    return colors.HexColor(value)
+
+
+@lru_cache(maxsize=512)
+def _qr_png_bytes(data: str, fill_color: str) -> bytes:
+    """
+    Encode a QR code to PNG bytes. Cached by payload, so re-downloading the
+    same ticket skips the (pure-Python, CPU-heavy) QR encode entirely.
+    """
+    import qrcode as qr_module
+    qr = qr_module.QRCode(
+        version=1,
+        error_correction=qr_module.constants.ERROR_CORRECT_L,
+        box_size=8,
+        border=1,
+        # Fixed mask: skips the 8-way best_mask_pattern penalty search, which
+        # is most of qrcode's encode time. Any mask is valid for scanners.
+        mask_pattern=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color=fill_color, back_color="white")
+
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _qr_image_reader(data: str, fill_color: str):
+    """
+    ReportLab ImageReader over the cached PNG. Built per call on purpose: a
+    cached reader keeps the decoded image (hundreds of KB) alive per payload.
+    """
+    from reportlab.lib.utils import ImageReader
+    return ImageReader(BytesIO(_qr_png_bytes(data, fill_color)))
+
+
 class TicketGenerator:
     """Generate PDF tickets for events"""
 
@@ -39,27 +82,34 @@ class TicketGenerator:
 
     def __init__(self):
         from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch, mm
         self.pagesize = A4
         self.width, self.height = self.pagesize
 
-    def generate_qr_code(self, data: str) -> BytesIO:
-        """Generate QR code as BytesIO"""
-        import qrcode as qr_module
-        qr = qr_module.QRCode(
-            version=1,
-            error_correction=qr_module.constants.ERROR_CORRECT_L,
-            box_size=8,
-            border=1,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-
-        img = qr.make_image(fill_color=self.NAVY, back_color="white")
-
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-        return buffer
+        # Fixed page geometry — depends only on the page size, so work it out
+        # once here rather than on every generate_ticket call
+        W, H = self.width, self.height
+        self.left = 1 * inch
+        self.right = W - 1 * inch
+        self.content_w = self.right - self.left
+        self.header_h = 1.4 * inch
+        self.accent_h = 4 * mm
+        self.logo_y = H - self.header_h + 0.25 * inch
+        self.logo_size = 0.9 * inch
+        self.card_x = self.left - 0.1 * inch
+        self.card_w = self.content_w + 0.2 * inch
+        self.event_card_top = H - self.header_h - self.accent_h - 0.3 * inch
+        self.event_card_h = 1.8 * inch
+        self.event_card_y = self.event_card_top - self.event_card_h
+        self.attendee_top = self.event_card_y - 0.25 * inch
+        self.attendee_h = 1.6 * inch
+        self.attendee_y = self.attendee_top - self.attendee_h
+        self.section_x = self.left + 0.1 * inch
+        self.row_step = 0.24 * inch
+        self.value_x = self.section_x + 1.2 * inch
+        self.qr_size = 1.5 * inch
+        self.qr_x = (W - self.qr_size) / 2
+        self.qr_y = self.attendee_y - self.qr_size - 0.4 * inch
 
     def generate_ticket(
         self,
@@ -81,44 +131,45 @@ class TicketGenerator:
         from reportlab.lib.utils import ImageReader
 
         buffer = BytesIO()
-        pdf = canvas.Canvas(buffer, pagesize=self.pagesize)
+        # Compressed content streams keep the download small; invariant output
+        # makes identical tickets byte-identical (no embedded timestamp / ID)
+        pdf = canvas.Canvas(buffer, pagesize=self.pagesize, pageCompression=1, invariant=1)
         pdf.setTitle(f"Event Ticket - {event_title}")
 
         W = self.width
         H = self.height
-        left = 1 * inch
-        right = W - 1 * inch
-        content_w = right - left
+        left = self.left
+        right = self.right
         ticket_ref = ticket_number or reference
 
         # ═══════════════════════════════════════════════════════
         # BACKGROUND
         # ═══════════════════════════════════════════════════════
-        pdf.setFillColor(colors.HexColor(self.GHOST))
+        pdf.setFillColor(_hex_color(self.GHOST))
         pdf.rect(0, 0, W, H, fill=True, stroke=False)
 
         # ═══════════════════════════════════════════════════════
         # HEADER BAR — navy strip at top
         # ═══════════════════════════════════════════════════════
-        header_h = 1.4 * inch
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        header_h = self.header_h
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.rect(0, H - header_h, W, header_h, fill=True, stroke=False)
 
         # Lime accent bar
-        accent_h = 4 * mm
-        pdf.setFillColor(colors.HexColor(self.LIME))
+        accent_h = self.accent_h
+        pdf.setFillColor(_hex_color(self.LIME))
         pdf.rect(0, H - header_h - accent_h, W, accent_h, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.TEAL))
+        pdf.setFillColor(_hex_color(self.TEAL))
         pdf.rect(0, H - header_h - accent_h - 2 * mm, W * 0.36, 2 * mm, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.CORAL))
+        pdf.setFillColor(_hex_color(self.CORAL))
         pdf.rect(W * 0.64, H - header_h - accent_h - 2 * mm, W * 0.36, 2 * mm, fill=True, stroke=False)
 
         # Logo
-        logo_y = H - header_h + 0.25 * inch
+        logo_y = self.logo_y
         try:
             if os.path.exists(_LOGO_PATH):
                 logo = ImageReader(_LOGO_PATH)
-                logo_size = 0.9 * inch
+                logo_size = self.logo_size
                 pdf.drawImage(logo, left, logo_y, width=logo_size, height=logo_size,
                               preserveAspectRatio=True, mask='auto')
                 text_x = left + 1.05 * inch
@@ -133,12 +184,12 @@ class TicketGenerator:
         pdf.drawString(text_x, logo_y + 0.55 * inch, "IESA")
 
         pdf.setFont("Helvetica", 9)
-        pdf.setFillColor(colors.HexColor("#CCCCCC"))
+        pdf.setFillColor(_hex_color("#CCCCCC"))
         pdf.drawString(text_x, logo_y + 0.32 * inch, "Industrial Engineering Students' Association")
         pdf.drawString(text_x, logo_y + 0.12 * inch, "University of Ibadan, Ibadan")
 
         # Ticket title — right
-        pdf.setFillColor(colors.HexColor(self.LIME))
+        pdf.setFillColor(_hex_color(self.LIME))
         pdf.setFont("Helvetica-Bold", 16)
         pdf.drawRightString(right, logo_y + 0.55 * inch, "EVENT TICKET")
 
@@ -150,24 +201,24 @@ class TicketGenerator:
         # ═══════════════════════════════════════════════════════
         # EVENT INFO CARD — lime background
         # ═══════════════════════════════════════════════════════
-        event_card_top = H - header_h - accent_h - 0.3 * inch
-        event_card_h = 1.8 * inch
-        event_card_y = event_card_top - event_card_h
-        card_x = left - 0.1 * inch
-        card_w = content_w + 0.2 * inch
+        event_card_top = self.event_card_top
+        event_card_h = self.event_card_h
+        event_card_y = self.event_card_y
+        card_x = self.card_x
+        card_w = self.card_w
 
         # Card shadow
-        pdf.setFillColor(colors.HexColor("#000000"))
+        pdf.setFillColor(_hex_color("#000000"))
         pdf.roundRect(card_x + 6, event_card_y - 6, card_w, event_card_h, 14, fill=True, stroke=False)
 
         # Lime card body
-        pdf.setFillColor(colors.HexColor(self.LIME))
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.LIME))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(3)
         pdf.roundRect(card_x, event_card_y, card_w, event_card_h, 14, fill=True, stroke=True)
 
         # Event title
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.setFont("Helvetica-Bold", 18)
         title_y = event_card_top - 0.5 * inch
 
@@ -204,32 +255,32 @@ class TicketGenerator:
         # ═══════════════════════════════════════════════════════
         # ATTENDEE CARD — white
         # ═══════════════════════════════════════════════════════
-        attendee_top = event_card_y - 0.25 * inch
-        attendee_h = 1.6 * inch
-        attendee_y = attendee_top - attendee_h
+        attendee_top = self.attendee_top
+        attendee_h = self.attendee_h
+        attendee_y = self.attendee_y
 
         # Card shadow
-        pdf.setFillColor(colors.HexColor("#000000"))
+        pdf.setFillColor(_hex_color("#000000"))
         pdf.roundRect(card_x + 5, attendee_y - 5, card_w, attendee_h, 12, fill=True, stroke=False)
 
         # Card body
         pdf.setFillColor(colors.white)
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(2)
         pdf.roundRect(card_x, attendee_y, card_w, attendee_h, 12, fill=True, stroke=True)
 
         # Section header
         y = attendee_top - 0.35 * inch
-        section_x = left + 0.1 * inch
+        section_x = self.section_x
 
-        pdf.setFillColor(colors.HexColor(self.LAVENDER))
+        pdf.setFillColor(_hex_color(self.LAVENDER))
         pdf.rect(section_x, y - 2, 3, 14, fill=True, stroke=False)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.setFont("Helvetica-Bold", 11)
         pdf.drawString(section_x + 10, y, "ATTENDEE INFORMATION")
 
         y -= 0.1 * inch
-        pdf.setStrokeColor(colors.HexColor("#E8E8E8"))
+        pdf.setStrokeColor(_hex_color("#E8E8E8"))
         pdf.setLineWidth(0.5)
         pdf.line(section_x, y, right - 0.1 * inch, y)
 
@@ -239,25 +290,29 @@ class TicketGenerator:
             ("Email", student_email),
             ("Level", student_level),
         ]
-        for label, value in details:
-            pdf.setFont("Helvetica", 9)
-            pdf.setFillColor(colors.HexColor("#888888"))
-            pdf.drawString(section_x, y, label)
-            pdf.setFont("Helvetica-Bold", 10)
-            pdf.setFillColor(colors.HexColor(self.NAVY))
-            pdf.drawString(section_x + 1.2 * inch, y, str(value))
-            y -= 0.24 * inch
+        row_ys = [y - i * self.row_step for i in range(len(details))]
+
+        # Two passes (labels, then values) so each font/colour is set once
+        pdf.setFont("Helvetica", 9)
+        pdf.setFillColor(_hex_color("#888888"))
+        for row_y, (label, _) in zip(row_ys, details):
+            pdf.drawString(section_x, row_y, label)
+
+        pdf.setFont("Helvetica-Bold", 10)
+        pdf.setFillColor(_hex_color(self.NAVY))
+        value_x = self.value_x
+        for row_y, (_, value) in zip(row_ys, details):
+            pdf.drawString(value_x, row_y, str(value))
 
         # ═══════════════════════════════════════════════════════
         # QR CODE — centered below attendee card
         # ═══════════════════════════════════════════════════════
         qr_data = f"IESA_EVENT:{event_id}|TICKET:{ticket_ref}|ATTENDEE:{student_email}"
-        qr_buffer = self.generate_qr_code(qr_data)
-        qr_image = ImageReader(qr_buffer)
+        qr_image = _qr_image_reader(qr_data, self.NAVY)
 
-        qr_size = 1.5 * inch
-        qr_x = (W - qr_size) / 2
-        qr_y = attendee_y - qr_size - 0.4 * inch
+        qr_size = self.qr_size
+        qr_x = self.qr_x
+        qr_y = self.qr_y
 
         # QR background card
         qr_card_padding = 0.15 * inch
@@ -267,7 +322,7 @@ class TicketGenerator:
         qr_card_h = qr_size + 2 * qr_card_padding + 0.3 * inch
 
         pdf.setFillColor(colors.white)
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(1.5)
         pdf.roundRect(qr_card_x, qr_card_y, qr_card_w, qr_card_h, 8, fill=True, stroke=True)
 
@@ -275,7 +330,7 @@ class TicketGenerator:
                       preserveAspectRatio=True, mask='auto')
 
         pdf.setFont("Helvetica-Bold", 8)
-        pdf.setFillColor(colors.HexColor(self.NAVY))
+        pdf.setFillColor(_hex_color(self.NAVY))
         pdf.drawCentredString(W / 2, qr_y - 0.18 * inch, "Scan at event entrance")
 
         # ═══════════════════════════════════════════════════════
@@ -283,7 +338,7 @@ class TicketGenerator:
         # ═══════════════════════════════════════════════════════
         footer_y = 1.0 * inch
         pdf.setFont("Helvetica-Oblique", 8)
-        pdf.setFillColor(colors.HexColor("#999999"))
+        pdf.setFillColor(_hex_color("#999999"))
         pdf.drawCentredString(W / 2, footer_y,
                              "This ticket is non-transferable. Present this ticket at the event.")
 
@@ -292,10 +347,10 @@ class TicketGenerator:
                              f"IESA · University of Ibadan · iesa@ui.edu.ng · Generated {datetime.now().strftime('%B %d, %Y')}")
 
         # Bottom accent lines
-        pdf.setStrokeColor(colors.HexColor(self.NAVY))
+        pdf.setStrokeColor(_hex_color(self.NAVY))
         pdf.setLineWidth(2)
         pdf.line(0, 0.3 * inch, W, 0.3 * inch)
-        pdf.setStrokeColor(colors.HexColor(self.LIME))
+        pdf.setStrokeColor(_hex_color(self.LIME))
         pdf.setLineWidth(1)
         pdf.line(0, 0.25 * inch, W, 0.25 * inch)
 
@@ -306,6 +361,10 @@ class TicketGenerator:
         return buffer
 
 
+# Lazy singleton — only created when the first ticket is generated
+_ticket_generator = None
+
+
 def generate_event_ticket(
     event_id: str,
     event_title: str,
@@ -320,9 +379,15 @@ def generate_event_ticket(
 ) -> BytesIO:
     """
     Convenience function to generate an event ticket
+
+    Uses a lazy singleton TicketGenerator so the page geometry is only
+    computed once per process.
     """
-    generator = TicketGenerator()
-    return generator.generate_ticket(
+    global _ticket_generator
+    if _ticket_generator is None:
+        _ticket_generator = TicketGenerator()
+
+    return _ticket_generator.generate_ticket(
         event_id=event_id,
         event_title=event_title,
         event_date=event_date,
@@ -334,3 +399,25 @@ def generate_event_ticket(
         ticket_number=ticket_number,
         event_category=event_category
     )
+
+
+@lru_cache(maxsize=32)
+def _cached_ticket_pdf(generated_on: str, **kwargs) -> bytes:
+    """
+    Whole-ticket cache. The PDF is a pure function of its inputs plus the
+    "Generated <date>" footer (canvas output is invariant), so the current
+    date is part of the key and entries naturally roll over each day.
+    Kept small (a few tens of KB per ticket) — it only needs to absorb
+    repeat downloads around an event, not hold every ticket in memory.
+    """
+    return generate_event_ticket(**kwargs).getvalue()
+
+
+def generate_event_ticket_bytes(**kwargs) -> bytes:
+    """
+    Same as generate_event_ticket, but returns the PDF as bytes so routes can
+    send it in a single Response body instead of streaming a BytesIO.
+
+    Repeat downloads of the same ticket are served from an in-process cache.
+    """
+    return _cached_ticket_pdf(datetime.now().strftime('%Y-%m-%d'), **kwargs)
@@ -0,0 +1,74 @@
+"""
+Shared MongoDB connection for the scripts in this folder.
+
+Each script used to build its own AsyncIOMotorClient (new pool, SRV lookup,
+topology discovery). get_db() caches one client per process so scripts run
+from a common harness — or a script that calls another — share it.
+
+Uses PyMongo's native asyncio client, so there is no Motor thread-pool hop
+per operation, and a small pool: these scripts are single-user and short-lived.
+"""
+
+import os
+
+from dotenv import load_dotenv
+from pymongo import AsyncMongoClient
+from pymongo.errors import OperationFailure
+
+# Resolve .env from backend/ regardless of the current working directory
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+MONGODB_URL = os.getenv("MONGODB_URL") or os.getenv("MONGO_URL") or "mongodb://localhost:27017"
+# Same default as app.db / app.utils.mongo and docker-compose
+DATABASE_NAME = os.getenv("DATABASE_NAME") or os.getenv("DB_NAME") or "iesa_db"
+
+_client = None
+
+
+def get_client() -> AsyncMongoClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncMongoClient(
+            MONGODB_URL,
+            minPoolSize=1,
+            maxPoolSize=10,  # enough for clear_and_seed's concurrent drops
+            serverSelectionTimeoutMS=5000,  # fail fast when the DB is unreachable
+        )
+    return _client
+
+
+def get_db():
+    """Return the configured database on the shared client."""
+    return get_client()[DATABASE_NAME]
+
+
+async def ensure_lookup_indexes(db) -> None:
+    """
+    Make sure the admin scripts' by-email, per-position and active-session
+    lookups are index seeks. create_index is a no-op when the index already exists; a conflicting
+    spec or duplicate emails are reported and skipped, not fatal.
+    """
+    specs = [
+        ("users", "email", {"unique": True}),
+        ("roles", [("userId", 1), ("position", 1)], {}),
+        # Partial: only the (normally single) active session is indexed, so
+        # find_one({"isActive": True}) hits a one-entry index
+        ("sessions", [("isActive", 1)], {
+            "partialFilterExpression": {"isActive": True},
+            "name": "active_session_partial",
+        }),
+    ]
+    for collection, keys, options in specs:
+        try:
+            await db[collection].create_index(keys, **options)
+        except OperationFailure as e:
+            print(f"⚠️  Could not ensure {collection} index {keys}: {e}")
+
+
+async def close_client() -> None:
+    """Close the shared client (call once, at the end of a script's run)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
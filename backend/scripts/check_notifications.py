@@ -19,24 +19,15 @@ import sys
 # Add parent dir so `app` is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
 
+from scripts._db import DATABASE_NAME, MONGODB_URL, close_client, get_db
 
-from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
-
-MONGO_URI = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-DB_NAME = os.getenv("DATABASE_NAME", "iesa_db")
-
-
-async def main():
-    client = AsyncIOMotorClient(MONGO_URI, serverSelectionTimeoutMS=10000)
-    db = client[DB_NAME]
 
+async def diagnose(db):
     print("=" * 60)
     print("IESA Notification Diagnostic")
-    print(f"DB: {DB_NAME} @ {MONGO_URI[:40]}...")
+    print(f"DB: {DATABASE_NAME} @ {MONGODB_URL[:40]}...")
     print("=" * 60)
 
     # 1. Check active session
@@ -76,7 +67,7 @@ async def main():
         {"$group": {"_id": "$level", "count": {"$sum": 1}}},
         {"$sort": {"_id": 1}},
     ]
-    level_dist = await db.enrollments.aggregate(pipeline).to_list(length=None)
+    level_dist = await (await db.enrollments.aggregate(pipeline)).to_list(length=None)
     print("  Level distribution:")
     for ld in level_dist:
         print(f"    {ld['_id']}: {ld['count']} student(s)")
@@ -162,7 +153,12 @@ async def main():
     print("Done. Check the output above for ❌ or ⚠️  markers.")
     print("=" * 60)
 
-    client.close()
+
+async def main():
+    try:
+        await diagnose(get_db())
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
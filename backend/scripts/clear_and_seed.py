@@ -22,10 +22,7 @@ import sys
 import os
 from datetime import datetime, timezone
 
-from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
-
-# Add backend root to path so dotenv resolution works properly
+# Add backend root to path so the shared scripts._db helper is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # ─── All MongoDB collections managed by the IESA platform ────────────────────
@@ -110,7 +107,13 @@ ALL_COLLECTIONS = [
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 async def clear_all_data(db, keep_users: bool = False) -> None:
-    """Delete all documents from every tracked collection."""
+    """
+    Drop every tracked collection.
+
+    drop() is a metadata operation, unlike delete_many({}) which removes (and
+    oplogs) each document individually. Dropping also removes indexes, so
+    callers must run ensure_indexes() afterwards.
+    """
     skip = {"users"} if keep_users else set()
     label = (
         "Clearing session/content data (keeping users)..."
@@ -119,14 +122,33 @@ async def clear_all_data(db, keep_users: bool = False) -> None:
     )
     print(f"\n   {label}")
 
-    for col_name in ALL_COLLECTIONS:
-        if col_name in skip:
-            continue
-        result = await db[col_name].delete_many({})
-        if result.deleted_count > 0:
-            print(f"   + Deleted {result.deleted_count:>6} docs from '{col_name}'")
+    existing = set(await db.list_collection_names())
+    targets = [c for c in ALL_COLLECTIONS if c not in skip]
+
+    # Collections are independent — drop them concurrently so the reset takes
+    # one round-trip's worth of latency instead of one per collection
+    await asyncio.gather(*(db.drop_collection(c) for c in targets if c in existing))
+
+    for col_name in targets:
+        if col_name in existing:
+            print(f"   + Dropped collection '{col_name}'")
         else:
-            print(f"   - (empty) '{col_name}'")
+            print(f"   - (missing) '{col_name}'")
+
+
+async def ensure_indexes(db) -> None:
+    """
+    Recreate every index after a reset. Dropping a collection removes its
+    unique indexes too (users.email, roles, paystackTransactions.reference,
+    ...), so the full init_db set is applied, not just the script lookups.
+    """
+    from app.scripts.init_db import COLLECTION_INDEXES, create_indexes
+
+    await create_indexes(db)
+    print(f"   + Ensured indexes on {len(COLLECTION_INDEXES)} collections")
+    # Same spec the app creates at startup for token -> user lookups
+    await db["users"].create_index("firebaseUid", unique=True, sparse=True)
+    print("   + Ensured users.firebaseUid index")
 
 
 def _current_semester() -> int:
@@ -194,17 +216,9 @@ async def main():
 
     args = parser.parse_args()
 
-    # Resolve .env from backend/
-    _env_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"
-    )
-    load_dotenv(_env_path)
-    mongo_url = (
-        os.getenv("MONGODB_URL")
-        or os.getenv("MONGO_URL")
-        or "mongodb://localhost:27017"
-    )
-    db_name = os.getenv("DATABASE_NAME") or os.getenv("DB_NAME") or "iesa"
+    # Loads backend/.env and resolves MONGODB_URL / DATABASE_NAME
+    from scripts._db import MONGODB_URL as mongo_url, DATABASE_NAME as db_name
+    from scripts._db import get_db, close_client
 
     print(f"\n{'='*55}")
     print(f"  IESA Database Reset — Clear All Data")
@@ -224,12 +238,12 @@ async def main():
         print("  --confirm flag set, proceeding...")
         print()
 
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
+    db = get_db()
 
     try:
         # ── 1. Clear all data ─────────────────────────────────────────────
         await clear_all_data(db, keep_users=False)
+        await ensure_indexes(db)
 
         # ── 2. Create session ─────────────────────────────────────────────
         print(f"\n   Setting up academic session...")
@@ -246,7 +260,7 @@ async def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        client.close()
+        await close_client()
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ import asyncio
 import sys
 import os
 import argparse
+from collections import defaultdict
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,16 +20,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 async def list_users(admins_only: bool = False, search: str = None) -> None:
     """List all users with their roles and positions."""
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from dotenv import load_dotenv
+    from scripts._db import get_db, close_client
 
-    load_dotenv()
-
-    mongo_url = os.getenv("MONGODB_URL") or "mongodb://localhost:27017"
-    db_name = os.getenv("DATABASE_NAME") or "iesa"
-
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
+    db = get_db()
     users = db["users"]
     roles = db["roles"]
 
@@ -48,20 +42,47 @@ async def list_users(admins_only: bool = False, search: str = None) -> None:
             {"lastName": {"$regex": search, "$options": "i"}},
         ]
 
-    # Get users
-    user_list = await users.find(query).sort("email", 1).to_list(length=1000)
-    
-    if not user_list:
+    # Only the fields we print — skips bios, skills, picture URLs, hashes
+    projection = {
+        "email": 1, "firstName": 1, "lastName": 1, "role": 1,
+        "isEmailVerified": 1, "currentLevel": 1, "matricNumber": 1,
+    }
+
+    # Stream users and categorize by role. Staff lists are small; for students
+    # only the first 20 are kept for display and the rest are just counted.
+    admins, excos, students = [], [], []
+    student_count = 0
+    cursor = users.find(query, projection).sort("email", 1).batch_size(200)
+    async for user in cursor:
+        role = user.get("role")
+        if role == "admin":
+            admins.append(user)
+        elif role == "exco":
+            excos.append(user)
+        else:
+            student_count += 1
+            if len(students) < 20:
+                students.append(user)
+
+    total = len(admins) + len(excos) + student_count
+    if not total:
         print("❌ No users found matching criteria.")
-        client.close()
+        await close_client()
         return
 
-    print(f"Found {len(user_list)} user(s):\n")
+    print(f"Found {total} user(s):\n")
 
-    # Categorize by role
-    admins = [u for u in user_list if u.get("role") == "admin"]
-    excos = [u for u in user_list if u.get("role") == "exco"]
-    students = [u for u in user_list if u.get("role") not in ["admin", "exco"]]
+    # Fetch active positions for every admin/exco in one query (not one per user)
+    positions_by_user = defaultdict(list)
+    staff_ids = [str(u["_id"]) for u in admins + excos]
+    if staff_ids:
+        role_docs = await roles.find(
+            {"userId": {"$in": staff_ids}, "isActive": True},
+            {"userId": 1, "position": 1},
+        ).to_list(length=None)
+        for r in role_docs:
+            if r.get("position"):
+                positions_by_user[r["userId"]].append(r["position"])
 
     # Print admins
     if admins:
@@ -73,9 +94,7 @@ async def list_users(admins_only: bool = False, search: str = None) -> None:
             name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
             verified = "✓" if user.get("isEmailVerified") else "✗"
             
-            # Get positions for this user
-            user_roles = await roles.find({"userId": user_id, "isActive": True}).to_list(length=100)
-            positions = [r.get("position") for r in user_roles if r.get("position")]
+            positions = positions_by_user.get(user_id)
             positions_str = ", ".join(positions) if positions else "None"
             
             print(f"   • {name:<30} {email:<35} [Verified: {verified}]")
@@ -92,8 +111,7 @@ async def list_users(admins_only: bool = False, search: str = None) -> None:
             name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
             verified = "✓" if user.get("isEmailVerified") else "✗"
             
-            user_roles = await roles.find({"userId": user_id, "isActive": True}).to_list(length=100)
-            positions = [r.get("position") for r in user_roles if r.get("position")]
+            positions = positions_by_user.get(user_id)
             positions_str = ", ".join(positions) if positions else "None"
             
             print(f"   • {name:<30} {email:<35} [Verified: {verified}]")
@@ -102,10 +120,9 @@ async def list_users(admins_only: bool = False, search: str = None) -> None:
 
     # Print students (limit to first 20 if many)
     if students and not admins_only:
-        print(f"🎓 STUDENTS ({len(students)} total)")
+        print(f"🎓 STUDENTS ({student_count} total)")
         print("-" * 90)
-        display_students = students[:20]
-        for user in display_students:
+        for user in students:
             email = user.get("email", "N/A")
             name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
             level = user.get("currentLevel", "N/A")
@@ -114,17 +131,17 @@ async def list_users(admins_only: bool = False, search: str = None) -> None:
             
             print(f"   • {name:<30} {email:<35} {level:<6} {matric:<10} [Verified: {verified}]")
         
-        if len(students) > 20:
-            print(f"\n   ... and {len(students) - 20} more students")
+        if student_count > len(students):
+            print(f"\n   ... and {student_count - len(students)} more students")
         print()
 
     # Summary
     print("="*90)
-    print(f"Total: {len(user_list)} user(s) | Admins: {len(admins)} | Excos: {len(excos)} | Students: {len(students)}")
+    print(f"Total: {total} user(s) | Admins: {len(admins)} | Excos: {len(excos)} | Students: {student_count}")
     print("="*90)
     print()
 
-    client.close()
+    await close_client()
 
 
 def main():
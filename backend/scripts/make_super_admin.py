@@ -21,48 +21,74 @@ Super Admin Powers:
 """
 
 import asyncio
+import re
 import sys
 import os
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import DeleteMany, InsertOne, ReturnDocument, WriteConcern
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Cheap shape check so typos are rejected before connecting to MongoDB
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 async def make_super_admin(email: str) -> None:
     """Grant super_admin position to a user."""
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    mongo_url = os.getenv("MONGODB_URL") or "mongodb://localhost:27017"
-    db_name = os.getenv("DATABASE_NAME") or "iesa"
-
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    users = db["users"]
-    roles = db["roles"]
+    from scripts._db import get_db, close_client, ensure_lookup_indexes
+
+    db = get_db()
+    now = datetime.now(timezone.utc)  # timestamps for the role document we insert
+    # One-off interactive admin writes: primary ack without waiting on the
+    # journal is enough (never use this in app code)
+    fast_writes = WriteConcern(w=1, j=False)
+    users = db.get_collection("users", write_concern=fast_writes)
+    roles = db.get_collection("roles", write_concern=fast_writes)
     sessions_collection = db["sessions"]
 
+    await ensure_lookup_indexes(db)
+
     print("\n" + "="*70)
     print("🔐 SUPER ADMIN ASSIGNMENT")
     print("="*70)
     print()
 
-    # Find user
-    user = await users.find_one({"email": email})
+    # Find user and grant admin in one round-trip; the pre-image tells us what
+    # the account looked like before. admins always have full access, so
+    # isExternalStudent is forced off whether or not they were already admin.
+    user = await users.find_one_and_update(
+        {"email": email},
+        {
+            "$set": {
+                "role": "admin",
+                "isExternalStudent": False,
+            },
+            "$currentDate": {"updatedAt": True},
+        },
+        projection={"firstName": 1, "lastName": 1, "role": 1, "department": 1, "isExternalStudent": 1},
+        return_document=ReturnDocument.BEFORE,
+    )
 
     if not user:
         print(f"❌ No user found with email: {email}")
         print()
         print("💡 Available users:")
-        async for u in users.find({}, {"email": 1, "firstName": 1, "lastName": 1, "role": 1}).limit(20):
-            role_label = u.get('role', 'student')
-            print(f"   • {u.get('firstName', '')} {u.get('lastName', '')} ({u.get('email', '')}) - {role_label}")
+        # Format the lines server-side; we only need the strings back
+        pipeline = [
+            {"$limit": 20},
+            {"$project": {"_id": 0, "line": {"$concat": [
+                {"$ifNull": ["$firstName", ""]}, " ",
+                {"$ifNull": ["$lastName", ""]}, " (",
+                {"$ifNull": ["$email", ""]}, ") - ",
+                {"$ifNull": ["$role", "student"]},
+            ]}}},
+        ]
+        async for u in await users.aggregate(pipeline):
+            print(f"   • {u['line']}")
         print()
-        client.close()
+        await close_client()
         sys.exit(1)
 
     user_id = str(user["_id"])
@@ -76,35 +102,20 @@ async def make_super_admin(email: str) -> None:
     print(f"   External Student: {user.get('isExternalStudent', False)}")
     print()
 
-    # Step 1: Update user role to admin (for dashboard access)
+    # Step 1: User role updated to admin above (for dashboard access)
     if user.get("role") != "admin":
         print("📝 Step 1: Granting admin role...")
-        await users.update_one(
-            {"_id": user["_id"]},
-            {
-                "$set": {
-                    "role": "admin",
-                    "isExternalStudent": False,  # admins always have full access
-                    "updatedAt": datetime.now(timezone.utc)
-                }
-            }
-        )
         print("   ✓ User role set to: admin")
         print("   ✓ isExternalStudent set to: False")
     else:
-        # Still enforce isExternalStudent = False on existing admins
-        await users.update_one(
-            {"_id": user["_id"]},
-            {"$set": {"isExternalStudent": False, "updatedAt": datetime.now(timezone.utc)}}
-        )
         print("✓ User already has admin role")
     print()
 
     # Step 2: Get active session
-    active_session = await sessions_collection.find_one({"isActive": True})
+    active_session = await sessions_collection.find_one({"isActive": True}, {"name": 1})
     if not active_session:
         print("❌ No active session found! Run init_db first.")
-        client.close()
+        await close_client()
         sys.exit(1)
 
     session_id = str(active_session["_id"])
@@ -116,12 +127,6 @@ async def make_super_admin(email: str) -> None:
     # Step 3: Create super_admin position role
     print("📝 Step 2: Assigning super_admin position...")
     
-    # Remove any existing super_admin position for this user
-    await roles.delete_many({
-        "userId": user_id,
-        "position": "super_admin"
-    })
-    
     # Create new super_admin role entry
     super_admin_role = {
         "userId": user_id,
@@ -130,35 +135,43 @@ async def make_super_admin(email: str) -> None:
         "isActive": True,
         "permissions": [],  # Empty - super_admin bypass check grants ALL
         "assignedBy": user_id,  # Self-assigned
-        "assignedAt": datetime.now(timezone.utc),
-        "createdAt": datetime.now(timezone.utc),
-        "updatedAt": datetime.now(timezone.utc)
+        "assignedAt": now,
+        "createdAt": now,
+        "updatedAt": now
     }
     
-    result = await roles.insert_one(super_admin_role)
-    print(f"   ✓ Super admin position created (ID: {result.inserted_id})")
+    # Replace any existing super_admin position for this user — the delete and
+    # insert go to the server as one ordered bulk write (one round-trip)
+    await roles.bulk_write([
+        DeleteMany({"userId": user_id, "position": "super_admin"}),
+        InsertOne(super_admin_role),
+    ], ordered=True)
+    print(f"   ✓ Super admin position created (ID: {super_admin_role['_id']})")
     print()
 
-    # Success summary
-    print("="*70)
-    print("✅ SUCCESS!")
-    print("="*70)
-    print()
-    print(f"🎉 {user_name} is now a SUPER ADMIN!")
-    print()
-    print("Powers granted:")
-    print("   ✓ Full dashboard access (admin role)")
-    print("   ✓ ALL permissions across platform")
-    print("   ✓ Can assign/revoke any role")
-    print("   ✓ Omnipotent privileges")
-    print()
-    print("🌐 Login at:")
-    print("   http://localhost:3000/admin/login")
-    print(f"   Email: {email}")
-    print("   (Authenticate via Firebase)")
-    print()
-
-    client.close()
+    # Success summary — one write instead of a print() per line
+    sys.stdout.write(
+        f"{'='*70}\n"
+        "✅ SUCCESS!\n"
+        f"{'='*70}\n"
+        "\n"
+        f"🎉 {user_name} is now a SUPER ADMIN!\n"
+        "\n"
+        "Powers granted:\n"
+        "   ✓ Full dashboard access (admin role)\n"
+        "   ✓ ALL permissions across platform\n"
+        "   ✓ Can assign/revoke any role\n"
+        "   ✓ Omnipotent privileges\n"
+        "\n"
+        "🌐 Login at:\n"
+        "   http://localhost:3000/admin/login\n"
+        f"   Email: {email}\n"
+        "   (Authenticate via Firebase)\n"
+        "\n"
+    )
+    sys.stdout.flush()
+
+    await close_client()
 
 
 def main():
@@ -171,6 +184,10 @@ def main():
         sys.exit(1)
 
     email = sys.argv[1].strip()
+    if not EMAIL_RE.match(email):
+        print(f"\n❌ Invalid email address: {email}\n")
+        sys.exit(1)
+
     asyncio.run(make_super_admin(email))
 
 
@@ -29,8 +29,7 @@ from bson import ObjectId
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+from scripts._db import DATABASE_NAME, MONGODB_URL, close_client, get_db
 
 # NOTE: Passwords handled by Firebase Auth — no passwordHash fields needed
 
@@ -2580,15 +2579,11 @@ async def main():
     parser.add_argument("--no-users", action="store_true", help="Skip user creation (reuse existing)")
     args = parser.parse_args()
 
-    load_dotenv()
-    mongo_url = os.getenv("MONGODB_URL") or os.getenv("MONGO_URL") or "mongodb://localhost:27017"
-    db_name   = os.getenv("DATABASE_NAME") or os.getenv("DB_NAME") or "iesa"
-
     print(f"\n{'=' * 60}")
     print(f"  IESA Dummy Data Seed Script")
     print(f"{'=' * 60}")
-    print(f"  Database: {db_name}")
-    print(f"  MongoDB:  {mongo_url}")
+    print(f"  Database: {DATABASE_NAME}")
+    print(f"  MongoDB:  {MONGODB_URL}")
     print(f"  Mode:     {'Fresh (clear all)' if args.fresh else 'Incremental'}")
 
     if args.fresh:
@@ -2597,8 +2592,7 @@ async def main():
             print("Aborted.")
             sys.exit(0)
 
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
+    db = get_db()
 
     try:
         # ── Clear ──────────────────────────────────────────────
@@ -2737,7 +2731,7 @@ async def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        client.close()
+        await close_client()
 
 
 if __name__ == "__main__":
@@ -10,24 +10,16 @@ from datetime import datetime, timezone
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+from scripts._db import DATABASE_NAME, close_client, get_db
 
 def _dt(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
     return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
 
-async def main():
-    load_dotenv()
-    mongo_url = os.getenv("MONGODB_URL") or os.getenv("MONGO_URL") or "mongodb://localhost:27017"
-    db_name   = os.getenv("DATABASE_NAME") or os.getenv("DB_NAME") or "iesa"
-
+async def seed_calendar(db):
     print(f"\n============================================================")
-    print(f"  Seeding UI 2025/2026 Academic Calendar into '{db_name}'")
+    print(f"  Seeding UI 2025/2026 Academic Calendar into '{DATABASE_NAME}'")
     print(f"============================================================")
 
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-
     # 1. Update or activate session 2025/2026
     session_doc = await db["sessions"].find_one({"name": "2025/2026"})
     sem1_start = _dt(2026, 1, 19)
@@ -282,5 +274,11 @@ async def main():
 
     print("\nAcademic Calendar successfully populated!")
 
+async def main():
+    try:
+        await seed_calendar(get_db())
+    finally:
+        await close_client()
+
 if __name__ == "__main__":
     asyncio.run(main())
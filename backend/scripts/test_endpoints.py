@@ -2,63 +2,95 @@ import asyncio
 import aiohttp
 import sys
 import os
-import json
 
 # Base URL for backend
 BASE_URL = "http://localhost:8000"
 
-async def test_endpoint(session, method, endpoint, params=None, data=None, token=None, description=""):
+async def test_endpoint(session, method, endpoint, params=None, data=None, token=None, description="", title=""):
+    # Output is collected and printed in one go, so blocks from requests that
+    # run concurrently (asyncio.gather) don't interleave line by line
+    lines = []
+    if title:
+        lines.append(f"\n--- {title} ---")
+
     headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
     
     url = f"{BASE_URL}{endpoint}"
-    print(f"\n[{method}] {url}")
+    lines.append(f"\n[{method}] {url}")
     if description:
-        print(f"Goal: {description}")
+        lines.append(f"Goal: {description}")
     if params:
-        print(f"Params: {params}")
+        lines.append(f"Params: {params}")
     
+    status = 500
     try:
         if method == "GET":
             async with session.get(url, params=params, headers=headers) as response:
                 status = response.status
-                text = await response.text()
-                print(f"Status: {status}")
+                lines.append(f"Status: {status}")
                 if status == 200:
-                    try:
-                        data = json.loads(text)
-                        preview = str(data)[:100] + "..." if len(str(data)) > 100 else str(data)
-                        print(f"Success! Data preview: {preview}")
-                    except:
-                         print(f"Success! (Response not JSON)")
+                    if response.content_type == "application/json":
+                        # Only a preview is shown, so read just the head of the
+                        # body instead of pulling a large list into memory
+                        head = await response.content.read(256)
+                        preview = head[:100].decode("utf-8", errors="replace")
+                        lines.append(f"Success! Data preview: {preview}{'...' if len(head) > 100 else ''}")
+                    else:
+                         lines.append(f"Success! (Response not JSON)")
                 else:
-                    print(f"Error Response: {text}")
-                return status
+                    text = await response.text()
+                    lines.append(f"Error Response: {text}")
         elif method == "POST":
             async with session.post(url, json=data, headers=headers) as response:
                 status = response.status
                 text = await response.text()
-                print(f"Status: {status}")
-                print(f"Response: {text}")
-                return status
+                lines.append(f"Status: {status}")
+                lines.append(f"Response: {text}")
     except Exception as e:
-        print(f"Exception: {e}")
-        return 500
+        lines.append(f"Exception: {e}")
+        status = 500
+
+    print("\n".join(lines))
+    return status
+
+
+async def test_payments(session, token):
+    """Payments need the active session first, so these two stay sequential."""
+    session_status = await test_endpoint(session, "GET", "/api/sessions/active", token=token, description="Get active session", title="Payments")
+    if session_status == 200:
+        # Now fetch payments with session
+        await test_endpoint(session, "GET", "/api/v1/payments/", token=token, description="Fetch payments")
 
 async def main():
     print("IESA API Endpoint Tester")
     print("------------------------")
     
     # 1. Health Check (Public)
-    async with aiohttp.ClientSession() as session:
+    # One keep-alive pool shared by all the concurrent requests below; the
+    # DNS cache means BASE_URL's host is resolved once, not per connection
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
         await test_endpoint(session, "GET", "/health", description="Check if backend is running")
         
         # 2. Token Input
         print("\nTo test protected endpoints, please provide a Firebase ID Token.")
         print("IMPORTANT: Do ensure this is the long JWT string, NOT just the User UID.")
         print("It usually starts with 'eyJ...' and is very long.")
-        token = input("Enter ID Token (press Enter to skip): ").strip()
+        # Prefer IESA_ID_TOKEN / argv; only prompt if neither is set, and do it
+        # in a worker thread so input() doesn't block the event loop
+        token = os.getenv("IESA_ID_TOKEN") or (sys.argv[1] if len(sys.argv) > 1 else "")
+        if not token:
+            loop = asyncio.get_running_loop()
+            token = await loop.run_in_executor(None, input, "Enter ID Token (press Enter to skip): ")
+        token = token.strip()
         
         if token and len(token) < 50:
             print(f"\n[WARNING] The token provided ('{token}') looks too short to be a valid JWT.")
@@ -70,43 +102,16 @@ async def main():
         else:
             print("\nTesting with provided token...")
 
-        # 3. Test Events
-        print("\n--- Events ---")
-        await test_endpoint(session, "GET", "/api/v1/events/", token=token, description="Fetch events (default to active session)")
-        
-        # 4. Test Announcements
-        print("\n--- Announcements ---")
-        await test_endpoint(session, "GET", "/api/v1/announcements/", token=token, description="Fetch announcements (default to active session)")
-
-        # 5. Test Resources
-        print("\n--- Resources (Library) ---")
-        await test_endpoint(session, "GET", "/api/v1/resources", token=token, description="Fetch resources (default to active session)")
-
-        # 6. Test Timetable
-        print("\n--- Timetable ---")
-        await test_endpoint(session, "GET", "/api/v1/timetable/classes", params={"level": 400}, token=token, description="Fetch timetable classes (Level 400)")
-
-        # 7. Test Payments
-        print("\n--- Payments ---")
-        # First get current session
-        print("  - Fetching active session first...")
-        session_status = await test_endpoint(session, "GET", "/api/sessions/active", token=token, description="Get active session")
-        if session_status == 200:
-            # Now fetch payments with session
-            await test_endpoint(session, "GET", "/api/v1/payments/", token=token, description="Fetch payments")
-        
-
-
-        # === Testing Paystack Transactions ===
-        print("\n=== Testing Paystack Transactions ===")
-        async with session.get(f"{BASE_URL}/api/v1/paystack/transactions", headers={"Authorization": f"Bearer {token}"}) as response:
-            print(f"[GET] {BASE_URL}/api/v1/paystack/transactions")
-            print(f"Status: {response.status}")
-            text = await response.text()
-            if response.status == 200:
-                print(f"Success! Response: {text[:100]}...")
-            else:
-                 print(f"Error Response: {text}")
+        # 3-8. The remaining checks are independent of each other, so run them
+        # concurrently; total time is the slowest request, not the sum
+        await asyncio.gather(
+            test_endpoint(session, "GET", "/api/v1/events/", token=token, description="Fetch events (default to active session)", title="Events"),
+            test_endpoint(session, "GET", "/api/v1/announcements/", token=token, description="Fetch announcements (default to active session)", title="Announcements"),
+            test_endpoint(session, "GET", "/api/v1/resources", token=token, description="Fetch resources (default to active session)", title="Resources (Library)"),
+            test_endpoint(session, "GET", "/api/v1/timetable/classes", params={"level": 400}, token=token, description="Fetch timetable classes (Level 400)", title="Timetable"),
+            test_payments(session, token),
+            test_endpoint(session, "GET", "/api/v1/paystack/transactions", token=token, description="Fetch Paystack transactions", title="Paystack Transactions"),
+        )
 
 
 if __name__ == "__main__":
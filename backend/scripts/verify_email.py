@@ -9,48 +9,67 @@ Useful when:
 
 Usage:
     python scripts/verify_email.py <email>
+    python scripts/verify_email.py --batch < emails.txt
 
 Example:
     python scripts/verify_email.py john@stu.ui.edu.ng
 """
 
 import asyncio
+import re
 import sys
 import os
-from datetime import datetime, timezone
+from pymongo import ReturnDocument, WriteConcern
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Cheap shape check so typos are rejected before connecting to MongoDB
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 async def verify_email(email: str) -> None:
     """Manually verify a user's email."""
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from dotenv import load_dotenv
-
-    load_dotenv()
+    from scripts._db import get_db, close_client, ensure_lookup_indexes
 
-    mongo_url = os.getenv("MONGODB_URL") or "mongodb://localhost:27017"
-    db_name = os.getenv("DATABASE_NAME") or "iesa"
+    db = get_db()
+    # One-off interactive admin write: primary ack without waiting on the
+    # journal is enough (never use this in app code)
+    users = db.get_collection("users", write_concern=WriteConcern(w=1, j=False))
 
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    users = db["users"]
+    await ensure_lookup_indexes(db)
 
     print("\n" + "="*70)
     print("✉️  EMAIL VERIFICATION")
     print("="*70)
     print()
 
-    # Find user
-    user = await users.find_one({"email": email})
+    projection = {"firstName": 1, "lastName": 1, "role": 1, "isEmailVerified": 1}
+
+    # Verify in one round-trip. The filter skips already-verified users, so
+    # their emailVerifiedAt is never overwritten; the pre-image is what we print.
+    # $currentDate stamps both fields with the server's clock.
+    user = await users.find_one_and_update(
+        {"email": email, "isEmailVerified": {"$ne": True}},
+        {
+            "$set": {"isEmailVerified": True},
+            "$currentDate": {"emailVerifiedAt": True, "updatedAt": True},
+        },
+        projection=projection,
+        return_document=ReturnDocument.BEFORE,
+    )
+    updated = user is not None
+
+    if not updated:
+        # Either missing or already verified — a cheap read tells which
+        user = await users.find_one({"email": email}, projection)
 
     if not user:
         print(f"❌ No user found with email: {email}")
         print()
         print("💡 Use 'python scripts/list_users.py' to see all users")
         print()
-        client.close()
+        await close_client()
         sys.exit(1)
 
     user_name = f"{user.get('firstName', '')} {user.get('lastName', '')}"
@@ -63,55 +82,94 @@ async def verify_email(email: str) -> None:
     print(f"   Current Status: {'✓ Verified' if is_verified else '✗ Not Verified'}")
     print()
 
-    if is_verified:
+    if not updated:
         print("✅ Email is already verified!")
         print()
-        client.close()
+        await close_client()
         return
 
-    # Verify the email
-    print("📝 Verifying email...")
-    result = await users.update_one(
-        {"_id": user["_id"]},
+    # Success summary — one write instead of a print() per line
+    sys.stdout.write(
+        "📝 Verifying email...\n"
+        "✅ Email successfully verified!\n"
+        "\n"
+        f"{'='*70}\n"
+        "🎉 SUCCESS!\n"
+        f"{'='*70}\n"
+        "\n"
+        f"User: {user_name}\n"
+        f"Email: {email}\n"
+        "Status: ✓ Verified\n"
+        "\n"
+        "The user can now log in without email verification.\n"
+        "\n"
+    )
+    sys.stdout.flush()
+
+    await close_client()
+
+
+async def verify_emails(emails: list[str]) -> None:
+    """Verify many emails with a single update_many."""
+    from scripts._db import get_db, close_client, ensure_lookup_indexes
+
+    db = get_db()
+    # One-off interactive admin write: primary ack without waiting on the
+    # journal is enough (never use this in app code)
+    users = db.get_collection("users", write_concern=WriteConcern(w=1, j=False))
+
+    await ensure_lookup_indexes(db)
+
+    print("\n" + "="*70)
+    print(f"✉️  BATCH EMAIL VERIFICATION ({len(emails)} emails)")
+    print("="*70)
+    print()
+
+    # One update_many with $in: N email-index probes in a single round-trip
+    result = await users.update_many(
+        {"email": {"$in": emails}, "isEmailVerified": {"$ne": True}},
         {
-            "$set": {
-                "isEmailVerified": True,
-                "emailVerifiedAt": datetime.now(timezone.utc),
-                "updatedAt": datetime.now(timezone.utc)
-            }
-        }
+            "$set": {"isEmailVerified": True},
+            "$currentDate": {"emailVerifiedAt": True, "updatedAt": True},
+        },
     )
+    verified = result.modified_count
 
-    if result.modified_count > 0:
-        print("✅ Email successfully verified!")
-        print()
-        print("="*70)
-        print("🎉 SUCCESS!")
-        print("="*70)
-        print()
-        print(f"User: {user_name}")
-        print(f"Email: {email}")
-        print(f"Status: ✓ Verified")
-        print()
-        print("The user can now log in without email verification.")
-        print()
-    else:
-        print("❌ Failed to verify email")
-        print()
+    print(f"✅ Verified: {verified}")
+    print(f"⚠️  Already verified or not found: {len(emails) - verified}")
+    print()
 
-    client.close()
+    await close_client()
 
 
 def main():
     """Main entry point."""
+    if len(sys.argv) == 2 and sys.argv[1] == "--batch":
+        # One email per line on stdin
+        emails = [line.strip() for line in sys.stdin if line.strip()]
+        invalid = [email for email in emails if not EMAIL_RE.match(email)]
+        for email in invalid:
+            print(f"❌ Skipping invalid email address: {email}")
+        emails = [email for email in emails if EMAIL_RE.match(email)]
+        if not emails:
+            print("\n❌ No valid emails on stdin\n")
+            sys.exit(1)
+        asyncio.run(verify_emails(emails))
+        return
+
     if len(sys.argv) != 2:
         print("\n❌ Usage: python scripts/verify_email.py <email>")
+        print("          python scripts/verify_email.py --batch < emails.txt")
         print("\nExample:")
         print("   python scripts/verify_email.py john@stu.ui.edu.ng")
         print()
         sys.exit(1)
 
     email = sys.argv[1].strip()
+    if not EMAIL_RE.match(email):
+        print(f"\n❌ Invalid email address: {email}\n")
+        sys.exit(1)
+
     asyncio.run(verify_email(email))
 
 
@@ -9,6 +9,7 @@ Provides:
 """
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
@@ -21,14 +22,23 @@ os.environ["DATABASE_NAME"] = "iesa_test_db"
 
 from app.main import app
 
+# One timestamp for every sample document (fixtures don't need wall-clock time)
+_NOW = datetime.now(timezone.utc)
+
 
 # ============================================
 # Application Fixtures
 # ============================================
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client():
-    """Create an async HTTP client for testing."""
+    """
+    Async HTTP client shared by the whole test run.
+
+    ASGITransport doesn't send lifespan events, so app startup never runs
+    here; sharing the client just avoids a new transport per test.
+    Dependency overrides still apply since they live on the app.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -75,8 +85,8 @@ def sample_user():
         "matricNumber": "123456",
         "level": "200L",
         "phone": "+234800000000",
-        "createdAt": datetime.now(timezone.utc),
-        "updatedAt": datetime.now(timezone.utc),
+        "createdAt": _NOW,
+        "updatedAt": _NOW,
     }
 
 
@@ -90,7 +100,7 @@ def sample_session():
         "endDate": "2025-07-31",
         "currentSemester": "first",
         "isActive": True,
-        "createdAt": datetime.now(timezone.utc),
+        "createdAt": _NOW,
     }
 
 
@@ -105,7 +115,7 @@ def sample_announcement():
         "category": "general",
         "sessionId": "test-session-id",
         "createdBy": "admin-user-id",
-        "createdAt": datetime.now(timezone.utc),
+        "createdAt": _NOW,
         "isActive": True,
     }
 
@@ -123,7 +133,7 @@ def sample_event():
         "location": "Engineering Building",
         "sessionId": "test-session-id",
         "createdBy": "admin-user-id",
-        "createdAt": datetime.now(timezone.utc),
+        "createdAt": _NOW,
     }
 
 
@@ -138,7 +148,7 @@ def sample_payment():
         "status": "completed",
         "reference": "PAY-TEST-123",
         "sessionId": "test-session-id",
-        "createdAt": datetime.now(timezone.utc),
+        "createdAt": _NOW,
     }
 
 
@@ -146,41 +156,32 @@ def sample_payment():
 # Database Mock Fixtures
 # ============================================
 
-@pytest.fixture
-def mock_db():
-    """Mock MongoDB database."""
+_MOCK_COLLECTIONS = ("users", "sessions", "announcements", "events", "payments")
+_ASYNC_COLLECTION_METHODS = ("find_one", "insert_one", "update_one", "delete_one")
+
+
+@pytest.fixture(scope="session")
+def _mock_db_session():
+    """Build the mock database object graph once per test run."""
     db = MagicMock()
-    
-    # Setup async mock methods
-    db.users = MagicMock()
-    db.users.find_one = AsyncMock()
-    db.users.find = MagicMock()
-    db.users.insert_one = AsyncMock()
-    db.users.update_one = AsyncMock()
-    db.users.delete_one = AsyncMock()
-    
-    db.sessions = MagicMock()
-    db.sessions.find_one = AsyncMock()
-    db.sessions.find = MagicMock()
-    db.sessions.insert_one = AsyncMock()
-    db.sessions.update_one = AsyncMock()
-    
-    db.announcements = MagicMock()
-    db.announcements.find_one = AsyncMock()
-    db.announcements.find = MagicMock()
-    db.announcements.insert_one = AsyncMock()
-    db.announcements.update_one = AsyncMock()
-    
-    db.events = MagicMock()
-    db.events.find_one = AsyncMock()
-    db.events.find = MagicMock()
-    db.events.insert_one = AsyncMock()
-    db.events.update_one = AsyncMock()
-    
-    db.payments = MagicMock()
-    db.payments.find_one = AsyncMock()
-    db.payments.find = MagicMock()
-    db.payments.insert_one = AsyncMock()
-    db.payments.update_one = AsyncMock()
+    for name in _MOCK_COLLECTIONS:
+        collection = MagicMock()
+        for method in _ASYNC_COLLECTION_METHODS:
+            setattr(collection, method, AsyncMock())
+        collection.find = MagicMock()  # returns a cursor, not awaited
+        setattr(db, name, collection)
     
     return db
+
+
+@pytest.fixture
+def mock_db(_mock_db_session):
+    """
+    Mock MongoDB database.
+
+    Shared across the session and reset before each test (calls, return
+    values and side effects). Configure it via return_value/side_effect
+    rather than replacing attributes, which would leak into later tests.
+    """
+    _mock_db_session.reset_mock(return_value=True, side_effect=True)
+    return _mock_db_session
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("reportlab")
+pytest.importorskip("qrcode")
+
+from app.utils.receipt_generator import generate_payment_receipt_async
+
+
+@pytest.mark.asyncio
+async def test_generate_payment_receipt_async_renders_pdf():
+    pdf_buffer = await generate_payment_receipt_async(
+        transaction_id="507f1f77bcf86cd799439011",
+        reference="IESA-TEST-001",
+        student_name="Ada Lovelace",
+        student_email="ada@example.com",
+        student_level="300L",
+        payment_title="Departmental Dues",
+        amount=5000.0,
+        paid_at=datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc),
+        student_matric="123456",
+    )
+
+    pdf = pdf_buffer.getvalue()
+    assert pdf.startswith(b"%PDF-")
+    assert pdf.rstrip().endswith(b"%%EOF")
@@ -236,7 +236,6 @@ export default function IESAAIPage() {
   const chatRef = useRef<HTMLDivElement | null>(null);
   const textareaRef = useRef<HTMLTextAreaElement | null>(null);
   const speechSynthRef = useRef<SpeechSynthesisUtterance | null>(null);
-  const typingIntervalRef = useRef<NodeJS.Timeout | null>(null);
   const conversationSyncTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const messagesLengthRef = useRef(0);
   const conversationsRef = useRef(conversations);
@@ -398,9 +397,6 @@ export default function IESAAIPage() {
   useEffect(() => {
     return () => {
       if ("speechSynthesis" in window) window.speechSynthesis.cancel();
-      if (typingIntervalRef.current) {
-        clearInterval(typingIntervalRef.current);
-      }
       if (conversationSyncTimeoutRef.current) {
         clearTimeout(conversationSyncTimeoutRef.current);
       }
@@ -612,43 +608,6 @@ export default function IESAAIPage() {
   }, [messages, currentConversationId, scheduleConversationSync]);
 
   /* ── typing animation ── */
-  const typeMessage = (fullText: string, messageId: number, suggestions?: string[]) => {
-    let index = 0;
-    setIsTyping(true);
-    
-    const interval = setInterval(() => {
-      if (index < fullText.length) {
-        index += 2; // Type 2 characters at a time for smooth animation
-        const currentText = fullText.substring(0, index);
-        setMessages((prev) =>
-          prev.map((m) =>
-            m.id === messageId ? { ...m, text: currentText } : m
-          )
-        );
-        // Scroll every tick so the message stays in view as it types
-        if (chatRef.current) {
-          chatRef.current.scrollTop = chatRef.current.scrollHeight;
-        }
-      } else {
-        clearInterval(interval);
-        setIsTyping(false);
-        if (handsFreeMode) {
-          speakMessage(fullText, messageId);
-        }
-        // Add suggestions after typing completes
-        if (suggestions) {
-          setMessages((prev) =>
-            prev.map((m) =>
-              m.id === messageId ? { ...m, suggestions } : m
-            )
-          );
-        }
-      }
-    }, 30); // 30ms per update = ~33 characters per second
-    
-    typingIntervalRef.current = interval;
-  };
-
   /* ── send message ── */
   const sendMessage = async (messageText?: string) => {
     const textToSend = messageText || input.trim();
@@ -712,7 +671,7 @@ export default function IESAAIPage() {
         content: msg.text,
       }));
 
-      const response = await fetch(getApiUrl("/api/v1/iesa-ai/chat"), {
+      const response = await fetch(getApiUrl("/api/v1/iesa-ai/chat/stream"), {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -725,17 +684,66 @@ export default function IESAAIPage() {
         }),
       });
 
-      if (!response.ok) throw new Error("Failed to get response");
+      if (!response.ok || !response.body) throw new Error("Failed to get response");
+
+      // Render tokens as they arrive (SSE) instead of waiting for the full reply
+      const showText = (text: string, suggestions?: string[]) => {
+        setMessages((prev) =>
+          prev.map((m) => (m.id === aiMessageId ? { ...m, text, suggestions } : m)),
+        );
+        if (chatRef.current) {
+          chatRef.current.scrollTop = chatRef.current.scrollHeight;
+        }
+      };
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let pending = "";
+      let fullText = "";
+      let suggestions: string[] | undefined;
+      let lastPaint = 0;
+
+      setIsTyping(true);
+      try {
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          pending += decoder.decode(value, { stream: true });
+          const events = pending.split("\n\n");
+          pending = events.pop() ?? "";
+          for (const event of events) {
+            if (!event.startsWith("data: ")) continue;
+            let payload;
+            try {
+              payload = JSON.parse(event.slice(6));
+            } catch {
+              // Skip a malformed frame rather than losing the reply so far
+              continue;
+            }
+            if (payload.token) {
+              fullText += payload.token;
+            } else if (payload.error) {
+              fullText = payload.error;
+            } else if (payload.done) {
+              suggestions = payload.suggestions;
+              if (payload.user_context) setUserContext(payload.user_context);
+            }
+          }
+          // Repaint at most every 50 ms rather than once per token
+          const now = Date.now();
+          if (now - lastPaint >= 50) {
+            showText(fullText);
+            lastPaint = now;
+          }
+        }
+      } finally {
+        setIsTyping(false);
+      }
 
-      const data = await response.json();
-      
-      if (data.user_context) {
-        setUserContext(data.user_context);
+      if (!fullText) throw new Error("Empty response");
+      showText(fullText, suggestions);
+      if (handsFreeMode) {
+        speakMessage(fullText, aiMessageId);
       }
-      
-      // Start typing animation
-      typeMessage(data.reply, aiMessageId, data.suggestions);
-      
     } catch {
       setMessages((prev) =>
         prev.map((m) =>